@@ -10,7 +10,9 @@ import time
 import tmos
 
 
-os = tmos.OS()
+# layers=1 is so we can use partial updates, see:
+#   https://github.com/pimoroni/presto/issues/56
+os = tmos.OS(layers=1)
 
 # Use a short timeout for the display to demonstrate screen dimming, set
 # the timeout to 0 to disable.
@@ -22,31 +24,60 @@ BLACK = os.presto.display.create_pen(0, 0, 0)
 
 os.presto.display.set_font("bitmap8")
 
+# The glow LED color only needs setting once, the backlight manager
+# will re-apply it with the appropriate brightness as the display dims.
+os.backlight_manager.set_glow_leds(255, 255, 255)
+
+# Only the top of the display containing the text changes, so we only
+# need to clear and update that area after the first draw.
+WIDTH, _ = os.presto.display.get_bounds()
+TEXT_REGION = tmos.Region(0, 0, WIDTH, 50)
+
+# Set to True to show the time of each update, so its easier to see the
+# effect of execution_frequency and touch_forces_execution when the task
+# is registered. This makes every invocation redraw the display.
+SHOW_UPDATE_TIME = False
+
+first_draw = True
+last_time = None
+
 
 def clock():
     """
     Draws the current date/time in the top-left.
     """
 
-    os.backlight_manager.set_glow_leds(255, 255, 255)
+    global first_draw, last_time
+
+    # The task may run more than once a second (e.g. when touched), so
+    # skip drawing if the displayed time hasn't changed.
+    now = time.localtime()[:6]
+    if now == last_time and not SHOW_UPDATE_TIME:
+        return
+    last_time = now
 
     display = os.presto.display
 
     display.set_pen(WHITE)
-    display.clear()
+    if first_draw:
+        display.clear()
+    else:
+        display.rectangle(*TEXT_REGION)
     display.set_pen(BLACK)
 
-    year, month, day, hours, mins, secs, _, __ = time.localtime()
+    year, month, day, hours, mins, secs = now
     display.text(
         f"{day:02d}/{month:02d}/{year} {hours:02d}:{mins:02d}:{secs:02d}", 10, 10
     )
 
-    # Show the update time, so its easier to see the effect of
-    # execution_frequency and touch_forces_execution when the task is
-    # registered.
-    display.text(f"Update @ {time.ticks_ms()}", 10, 30)
+    if SHOW_UPDATE_TIME:
+        display.text(f"Update @ {time.ticks_ms()}", 10, 30)
 
-    os.presto.update()
+    if first_draw:
+        os.update_display()
+        first_draw = False
+    else:
+        os.update_display(TEXT_REGION)
 
 
 # Add our function to display the time as a task, so it will be called
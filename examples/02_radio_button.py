@@ -6,16 +6,19 @@ background.
 from presto import PicoGraphics
 
 from tmos import MSG_DEBUG, OS, Region
-from tmos_ui import RadioButton, Page, Theme, WindowManager
+from tmos_ui import RadioButton, StaticPage, Theme, WindowManager, get_pen
 
 os = OS(layers=1)
 wm = WindowManager(os)
 
 
-class ColorPage(Page):
+class ColorPage(StaticPage):
+    """
+    The page only changes when the radio button is used, so it is a
+    StaticPage, which is only redrawn when a touch changes its controls.
+    """
 
     title = "Colors"
-    execution_frequency = 1
 
     pen = None
 
@@ -27,10 +30,11 @@ class ColorPage(Page):
         p = window_manager.theme.padding
 
         options = ["Red", "Green", "Blue"]
+        display = window_manager.display
         pens = [
-            window_manager.display.create_pen(255, 0, 0),
-            window_manager.display.create_pen(0, 255, 0),
-            window_manager.display.create_pen(0, 0, 255),
+            get_pen(display, (255, 0, 0)),
+            get_pen(display, (0, 255, 0)),
+            get_pen(display, (0, 0, 255)),
         ]
 
         self.pen = pens[0]
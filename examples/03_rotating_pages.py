@@ -23,6 +23,8 @@ class PageWithTime(Page):
     It includes buttons to switch between adjacent pages.
     """
 
+    _time_only = False
+
     def setup(self, region: Region, window_manager: "WindowManager"):
         """
         This method is called before the page is first displayed, or if
@@ -60,6 +62,38 @@ class PageWithTime(Page):
         next_tn.on_button_up = window_manager.next_page
         self._controls.append(next_tn)
 
+        # Only the time changes between ticks, so we can redraw and
+        # update just that area of the display, unless we need to draw
+        # everything (e.g. after setup, or when touches change buttons).
+        theme = window_manager.theme
+        self._title_xy = to_screen(region, padding, padding)
+        self._time_xy = to_screen(region, padding, padding + theme.line_spacing(2))
+        self._time_region = Region(
+            region.x, self._time_xy[1], region.width, theme.line_spacing()
+        )
+        self._time_only = False
+
+    def will_show(self):
+        self._time_only = False
+
+    def tick(self, region: Region, window_manager: "WindowManager"):
+        """
+        Re-implements tick to only draw the time when possible.
+        """
+        # Full updates may be needed for other reasons, e.g. theme
+        # changes or a modal page being dismissed.
+        if self._time_only and not self.update_pending and not window_manager.os.touch.state:
+            theme = window_manager.theme
+            theme.clear_display(window_manager.display, self._time_region)
+            self._draw_time(window_manager.display, theme)
+            window_manager.request_display_update(self._time_region)
+            return
+
+        super().tick(region, window_manager)
+        # Touches change the state of the buttons, so keep drawing
+        # everything until the tick after they end.
+        self._time_only = not window_manager.os.touch.state
+
     def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
         """
         Clear the screen and draw the title as text, using theme colors
@@ -71,15 +105,14 @@ class PageWithTime(Page):
         We don't need to update the display here as this will be done
         once controls are drawn.
         """
-        p = theme.padding
-
         theme.clear_display(display, region)
-        # Make sure we draw within the specified region, which might not
-        # be the whole screen, or have an origin at 0, 0.
-        theme.text(display, self.title, *to_screen(region, p, p), rel_scale=2)
-        theme.text(
-            display, f" @ {time.ticks_ms()}", *to_screen(region, p, p + theme.line_spacing(2))
-        )
+        # Positions are calculated in setup, relative to the region, as
+        # it might not be the whole screen, or have an origin at 0, 0.
+        theme.text(display, self.title, *self._title_xy, rel_scale=2)
+        self._draw_time(display, theme)
+
+    def _draw_time(self, display: PicoGraphics, theme: Theme):
+        theme.text(display, f" @ {time.ticks_ms()}", *self._time_xy)
 
 
 page_one = PageWithTime()
@@ -30,23 +30,38 @@ class ClockPage(Page):
     """
 
     title = "Clock"
-    execution_frequency = 1
+    # Check the time a few times a second, so the display follows the
+    # second boundary closely, but only redraw when it has changed.
+    execution_frequency = 4
 
-    def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
+    _last_time = None
+
+    def setup(self, region: Region, window_manager: "WindowManager"):
+        # setup is called whenever the region or theme changes, so
+        # layout can be calculated once here, rather than every draw.
+        # Make sure we draw within the specified region, which might not
+        # be the whole screen, or have an origin at 0, 0.
+        p = window_manager.theme.padding
+        self._text_xy = to_screen(region, p, p)
+        self._last_time = None
+
+    def will_show(self):
+        self._last_time = None
 
-        p = theme.padding
+    def tick(self, region: Region, window_manager: "WindowManager"):
+        now = time.time()
+        if now == self._last_time:
+            return
+        self._last_time = now
+        super().tick(region, window_manager)
+
+    def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
 
         theme.clear_display(display, region)
 
-        # Make sure we draw within the specified region, which might not
-        # be the whole screen, or have an origin at 0, 0.
-        year, month, day, hours, mins, secs, _, __ = time.localtime()
-        theme.text(
-            display,
-            f"{day:02d}/{month:02d}/{year} {hours:02d}:{mins:02d}:{secs:02d}",
-            *to_screen(region, p, p),
-            rel_scale=2,
-        )
+        year, month, day, hours, mins, secs, _, __ = time.localtime(self._last_time)
+        text = f"{day:02d}/{month:02d}/{year} {hours:02d}:{mins:02d}:{secs:02d}"
+        theme.text(display, text, *self._text_xy, rel_scale=2)
 
 
 class TextPage(StaticPage):
@@ -56,12 +71,13 @@ class TextPage(StaticPage):
 
     title = "Wordage"
 
-    def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
-
-        p = theme.padding
+    def setup(self, region: Region, window_manager: "WindowManager"):
+        p = window_manager.theme.padding
+        self._text_xy = to_screen(region, p, p)
 
+    def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
         theme.clear_display(display, region)
-        theme.text(display, "The\nCat\nsat\non\the\nMat", *to_screen(region, p, p), rel_scale=2)
+        theme.text(display, "The\nCat\nsat\non\the\nMat", *self._text_xy, rel_scale=2)
 
 
 class SetupPage(StaticPage):
@@ -89,18 +105,23 @@ class SetupPage(StaticPage):
         #
         # **Not recommended in normal use.**
 
+        t = window_manager.theme
+        p = t.padding
+        control_height = t.control_height
+
+        # Text positions do follow the region, so are always updated.
+        self._title_xy = to_screen(region, p, p)
+        self._footer_xy = to_screen(region, p, region.height - p - t.base_line_height)
+
         if self._controls:
             return
-
-        t = window_manager.theme
-        p = window_manager.theme.padding
         y = 80
         w = region.width - p - p
 
         # Create a button that toggles the systray visibility
 
         show_hide = MomentaryButton(
-            Region(region.x + p, y, w, t.control_height), title="Toggle Systray"
+            Region(region.x + p, y, w, control_height), title="Toggle Systray"
         )
         show_hide.on_button_up = lambda: window_manager.set_systray_visible(
             not window_manager.systray_visible
@@ -117,7 +138,7 @@ class SetupPage(StaticPage):
             window_manager.set_systray_position(new_pos)
 
         position_selector = RadioButton(
-            Region(region.x + p, y + t.control_height + p, w, t.control_height),
+            Region(region.x + p, y + control_height + p, w, control_height),
             positions,
             current_index=current_position,
         )
@@ -130,16 +151,9 @@ class SetupPage(StaticPage):
         how the systray affects the pages region.
         """
 
-        p = theme.padding
-
         theme.clear_display(display, region)
-        theme.text(display, "Systray Setup", *to_screen(region, p, p), rel_scale=2)
-
-        theme.text(
-            display,
-            "See me adjust my position",
-            *to_screen(region, p, region.height - p - theme.base_line_height),
-        )
+        theme.text(display, "Systray Setup", *self._title_xy, rel_scale=2)
+        theme.text(display, "See me adjust my position", *self._footer_xy)
 
 
 wm.add_page(ClockPage(), make_current=True)
@@ -18,6 +18,10 @@ class APage(Page):
 
     title = "Async Events"
 
+    # Updating at 10Hz is plenty to spot blocking event callbacks,
+    # without re-drawing (and formatting the text) every run loop.
+    execution_frequency = 10
+
     def setup(self, region: Region, window_manager: WindowManager):
         """
         Create buttons with sync and async event callbacks.
@@ -28,6 +32,11 @@ class APage(Page):
         def sync_buzz():
             """
             Buzzes for 1 second synchronously.
+
+            This blocks the run loop, so the page won't update until it
+            returns. The OS will post a message to say as much (see
+            OS.slow_task_warning_ms). Use async callbacks for anything
+            that waits.
             """
             os.buzzer.set_tone(100)
             time.sleep(1)
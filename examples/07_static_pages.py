@@ -25,30 +25,33 @@ class UpdatePage(StaticPage):
         Adds a button to request a page update.
         """
 
-        p = window_manager.theme.padding
+        theme = window_manager.theme
+        p = theme.padding
         update_region = Region(p, region.height - p - 50, region.width - p - p, 50)
 
+        # The area of the page occupied by the text, so we only need to
+        # redraw that when requesting an update.
+        text_height = theme.line_spacing(rel_scale=2)
+        text_region = Region(region.x, region.y, region.width, text_height + p + p)
+        self._text_xy = to_screen(region, p, p)
+
         update_btn = MomentaryButton(update_region, "Update in 1s", title_rel_scale=2)
 
         async def request_update():
             # The touch to press the button will cause an update, which
             # masks the fact that we requested one, so request one 1s
             # later to let the touch updates finish.
-            asyncio.sleep(1.0)
-            self.needs_update = True
+            await asyncio.sleep(1.0)
+            self.mark_dirty(text_region)
 
         update_btn.on_button_up = request_update
-        self._controls.append(update_btn)
+        # setup is called again if the region changes, so replace rather
+        # than append to avoid accumulating duplicate buttons.
+        self._controls = [update_btn]
 
     def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
-        p = theme.padding
         theme.clear_display(display, region)
-        theme.text(
-            display,
-            f"Update @ {time.ticks_ms()}",
-            *to_screen(region, p, p),
-            rel_scale=2,
-        )
+        theme.text(display, f"Update @ {time.ticks_ms()}", *self._text_xy, rel_scale=2)
 
 
 wm.add_page(UpdatePage(), make_current=True)
@@ -87,6 +87,17 @@ class ClockAccessory(Systray.Accessory):
 boop_accessory = BoopAccessory()
 clock_accessory = ClockAccessory()
 
+POS_L = Systray.Accessory.POSITION_LEADING
+POS_T = Systray.Accessory.POSITION_TRAILING
+
+# The (boop, clock) accessory positions for each option
+ACCESSORY_POSITIONS = {
+    POS_L: (POS_L, POS_L),
+    POS_T: (POS_T, POS_T),
+    "split": (POS_L, POS_T),
+    "none": (None, None),
+}
+
 
 def set_accessory_positions(position: str):
     """
@@ -95,22 +106,9 @@ def set_accessory_positions(position: str):
 
     # Remove the accessories if they've already been added, so we can
     # re-insert them in our new favoured position.
-    l, t = wm.systray_accessories()
-    if l or t:
-        wm.remove_systray_accessory(boop_accessory)
-        wm.remove_systray_accessory(clock_accessory)
-
-    pos_l = Systray.Accessory.POSITION_LEADING
-    pos_t = Systray.Accessory.POSITION_TRAILING
+    wm.remove_all_systray_accessories()
 
-    positions = {
-        pos_l: (pos_l, pos_l),
-        pos_t: (pos_t, pos_t),
-        "split": (pos_l, pos_t),
-        "none": (None, None),
-    }
-
-    pos_boop, pos_clock = positions[position]
+    pos_boop, pos_clock = ACCESSORY_POSITIONS[position]
 
     if pos_boop:
         wm.add_systray_accessory(boop_accessory, position=pos_boop)
@@ -143,12 +141,13 @@ class OptionsPage(StaticPage):
             current_pos = options[new_index]
             set_accessory_positions(current_pos)
 
-        p = window_manager.theme.padding
+        theme = window_manager.theme
+        p = theme.padding
         radio_region = Region(
             region.x + p,
             region.height - p - 60,
             region.width - p - p,
-            window_manager.theme.control_height,
+            theme.control_height,
         )
         radio_button = RadioButton(radio_region, options, current_index=options.index(current_pos))
         radio_button.on_current_index_changed = option_changed
@@ -180,11 +179,14 @@ class InfoPage(StaticPage):
 
     title = "Info"
 
+    def setup(self, region: Region, window_manager: "WindowManager"):
+        p = window_manager.theme.padding
+        self._text_xy = to_screen(region, p, p)
+
     def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
-        p = theme.padding
+        # clear_display leaves the foreground pen set
         theme.clear_display(display)
-        display.set_pen(theme.foreground_pen)
-        theme.text(display, INFO_TEXT, *to_screen(region, p, p))
+        theme.text(display, INFO_TEXT, *self._text_xy)
 
 
 wm.add_page(InfoPage(), make_current=True)
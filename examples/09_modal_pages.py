@@ -13,6 +13,7 @@ from tmos_ui import (
     Systray,
     WindowManager,
     Theme,
+    get_pen,
     to_screen,
 )
 
@@ -20,8 +21,8 @@ os = OS(layers=1)
 # Show the systray by default to make the modality more obvious.
 wm = WindowManager(os, systray_visible=True)
 
-YELLOW = wm.display.create_pen(255, 255, 100)
-RED = wm.display.create_pen(255, 100, 100)
+YELLOW = get_pen(wm.display, (255, 255, 100))
+RED = get_pen(wm.display, (255, 100, 100))
 
 
 class ModalPage(StaticPage):
@@ -48,16 +49,13 @@ class ModalPage(StaticPage):
         close_button.on_button_up = window_manager.clear_modal_page
         self._controls.append(close_button)
 
+        self._text_xy = to_screen(region, p, region.y + region.height // 2)
+
     def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
         display.set_pen(self.bg)
         display.rectangle(*region)
         display.set_pen(theme.foreground_pen)
-        theme.text(
-            display,
-            self.text,
-            *to_screen(region, theme.padding, region.y + region.height // 2),
-            rel_scale=2,
-        )
+        theme.text(display, self.text, *self._text_xy, rel_scale=2)
 
 
 class ControlsPage(StaticPage):
@@ -69,14 +67,15 @@ class ControlsPage(StaticPage):
 
     def setup(self, region: Region, window_manager: WindowManager):
 
-        p = window_manager.theme.padding
+        theme = window_manager.theme
+        p = theme.padding
+        height = theme.control_height
 
         def add_modal_page_button(title: str, bg, text: str, y: int) -> int:
             """
             Adds a button that displays a modal page with the supplied text.
             """
             page = ModalPage(text, bg)
-            height = window_manager.theme.control_height
             button_region = Region(region.x + p, region.y + y, region.width - p - p, height)
             show_button = MomentaryButton(button_region, title, title_rel_scale=2)
             # Ask the window manager to show the page modally
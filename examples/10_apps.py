@@ -6,7 +6,7 @@ An demonstration of apps
 from presto import PicoGraphics
 
 from tmos import OS
-from tmos_ui import StaticPage, WindowManager, to_screen
+from tmos_ui import StaticPage, WindowManager, get_pen, to_screen
 from tmos_apps import App, AppManager
 
 os = OS(layers=1, full_res=False)
@@ -25,11 +25,18 @@ class SimplePage(StaticPage):
         self.text = text
         self.bg = bg
 
+    def setup(self, region: "Region", window_manager: "WindowManager"):
+        # setup is called again if the theme changes, so the fallback
+        # pen will always be current.
+        theme = window_manager.theme
+        self._bg_pen = self.bg or theme.background_pen
+        self._text_xy = to_screen(region, theme.padding, theme.padding)
+
     def _draw(self, display: PicoGraphics, region: "Region", theme: "Theme"):
-        display.set_pen(self.bg or theme.background_pen)
+        display.set_pen(self._bg_pen)
         display.rectangle(*region)
         display.set_pen(theme.foreground_pen)
-        theme.text(display, self.text, *to_screen(region, theme.padding, theme.padding))
+        theme.text(display, self.text, *self._text_xy)
 
 
 class ColorsApp(App):
@@ -37,8 +44,8 @@ class ColorsApp(App):
     An app with some colorful pages.
     """
 
-    YELLOW = wm.display.create_pen(255, 255, 100)
-    RED = wm.display.create_pen(255, 100, 100)
+    YELLOW = get_pen(wm.display, (255, 255, 100))
+    RED = get_pen(wm.display, (255, 100, 100))
 
     name = "Colors"
 
@@ -74,8 +74,9 @@ class ThemePage(StaticPage):
         # Note, as themes can change the size of UI elements, setup will
         # be called when the theme changes.
 
-        p = window_manager.theme.padding
-        control_height = window_manager.theme.control_height
+        theme = window_manager.theme
+        p = theme.padding
+        control_height = theme.control_height
         available_width = region.width - p - p
         half_Width = (available_width - p) // 2
         y = region.y + p
@@ -131,7 +132,7 @@ class ControlPage(StaticPage):
         # Create a radio button that chooses where the systray appears.
 
         t = window_manager.theme
-        p = window_manager.theme.padding
+        p = t.padding
         x = region.x + p
         y = region.y + t.line_spacing() + p
         w = region.width - p - p
@@ -22,7 +22,7 @@ functionality from other classes to add additional features:
 
 - BacklightManager: Timeout-based backlight / glow LED dimming/sleep.
 
-These are added in explicit order in the main run loop (see __tick),
+These are added in explicit order in the main run loop (see run_async),
 around user specified tasks to ensure consistent order of operations and
 state management.
 """
@@ -33,7 +33,7 @@ import asyncio
 import sys
 import time
 
-from collections import namedtuple
+from collections import deque, namedtuple
 
 import ntptime
 
@@ -41,6 +41,29 @@ from presto import Presto, Buzzer
 from picographics import PicoGraphics
 from touch import FT6236
 
+try:
+    import micropython
+    from micropython import const
+except ImportError:
+    # Off-device (e.g. tests), there is no native code emitter. Note the
+    # decorator must be written as @micropython.native for the
+    # MicroPython compiler to recognise it.
+    class micropython:  # pylint: disable=invalid-name
+        """
+        A stand-in for the micropython code emitter decorators.
+        """
+
+        @staticmethod
+        def native(fn):
+            return fn
+
+    def const(value):
+        """
+        A stand-in for micropython.const, on-device, constants are folded
+        into the bytecode by the compiler.
+        """
+        return value
+
 
 __all__ = [
     "BacklightManager",
@@ -52,6 +75,17 @@ __all__ = [
     "MSG_SEVERITY_NAMES",
 ]
 
+# Bound once, as these are called in the run loop's hot path and a
+# module global avoids a further attribute lookup on each call.
+_ticks_us = time.ticks_us
+_ticks_diff = time.ticks_diff
+_ticks_add = time.ticks_add
+
+# Platform hardware config
+_BUZZER_PIN = const(43)
+_GLOW_LED_PIN = const(33)
+_GLOW_LED_COUNT = const(7)
+
 MSG_DEBUG = 0
 MSG_INFO = 1
 MSG_WARNING = 2
@@ -77,7 +111,7 @@ class BacklightManager:
     """
 
     presto: Presto = None
-    num_leds: int = 7
+    num_leds: int = _GLOW_LED_COUNT
 
     DISPLAY_ON = "on"
     DISPLAY_DIM = "dim"
@@ -114,7 +148,15 @@ class BacklightManager:
     glow_led_brighnesses: BrightnessSettings
 
     __requested_glow_led_rgb: tuple | None = None
+    __glow_led_phase: str | None = None
+    __pushed_glow_led_rgb: tuple | None = None
+    __pushed_backlight_brightness: float | None = None
+    __consuming_touch: bool = False
     __last_interaction_s: int | None = None
+    __next_phase_change_s: int | None = None
+    # The timeouts __next_phase_change_s was determined for
+    __phase_change_dim_s: int | None = None
+    __phase_change_sleep_s: int | None = None
 
     def __init__(self):
         """
@@ -136,37 +178,78 @@ class BacklightManager:
         The Presto hardware doesn't support an independent brightness
         for the LEDs, so we simulate one by taking the requested
         brightness for the display phase, and multiplying the requested
-        LED color.
+        LED color. The LEDs are only updated if this results in a
+        different color to the last one set. The scaled color is only
+        re-calculated if the requested color or display phase change.
         """
         if not self.presto:
             return
 
         rgb = (r, g, b)
+        phase = self.display_phase if self.display_phase_controls_glow_leds else None
 
+        if rgb == self.__requested_glow_led_rgb and phase == self.__glow_led_phase:
+            return
         self.__requested_glow_led_rgb = rgb
+        self.__glow_led_phase = phase
 
-        if self.display_phase and self.display_phase_controls_glow_leds:
-            brightness = self.glow_led_brighnesses.for_phase(self.display_phase)
-            rgb = [int(v * brightness) for v in rgb]
+        if phase:
+            brightness = self.glow_led_brighnesses.for_phase(phase)
+            rgb = (int(r * brightness), int(g * brightness), int(b * brightness))
 
+        if rgb == self.__pushed_glow_led_rgb:
+            return
+        self.__pushed_glow_led_rgb = rgb
+
+        r, g, b = rgb
+        set_led_rgb = self.presto.set_led_rgb
         for i in range(self.num_leds):
-            self.presto.set_led_rgb(i, *rgb)
+            set_led_rgb(i, r, g, b)
 
-    def tick(self, time_now_s: int):
+    @property
+    def consuming_touch(self) -> bool:
+        """
+        Whether a touch that caused a display phase transition is still
+        active, and so should be ignored. See display_wake_consumes_touch.
+        """
+        return self.__consuming_touch
 
+    def tick(self, time_now_s: int, touch_active: bool | None = None):
+        """
+        Updates the display phase, called each run loop cycle.
+
+        :param time_now_s: The current time in seconds.
+        :param touch_active: The current touch state, if already known,
+          otherwise it is read from the presto instance.
+        """
         if not self.presto:
             return
 
-        if self.__last_interaction_s is None or self.presto.touch.state:
+        if touch_active is None:
+            touch_active = self.presto.touch.state
+        if not touch_active:
+            self.__consuming_touch = False
+
+        if self.__last_interaction_s is None or touch_active:
             self.__last_interaction_s = time_now_s
 
+        # Without a touch, nothing can change until the next phase change
+        # is due (if ever), unless the timeouts have been changed.
+        if not touch_active:
+            timeouts = self.display_timeouts
+            if (
+                timeouts.dim == self.__phase_change_dim_s
+                and timeouts.sleep == self.__phase_change_sleep_s
+            ):
+                next_phase_change_s = self.__next_phase_change_s
+                if next_phase_change_s is None or time_now_s <= next_phase_change_s:
+                    return
+
         changed = self.update_display_phase(time_now_s, self.__last_interaction_s)
-        if changed and self.display_wake_consumes_touch:
-            # Wait for the touch to end so that the current page won't
-            # see it when its tick is called.
-            while self.presto.touch.state:
-                time.sleep_ms(5)
-                self.presto.touch.poll()
+        if changed and touch_active and self.display_wake_consumes_touch:
+            # Ignore the touch until it ends so that the current page
+            # won't see it when its tick is called.
+            self.__consuming_touch = True
 
     def update_display_phase(self, time_now_s: int, last_interaction_s: int) -> bool:
         """
@@ -184,9 +267,9 @@ class BacklightManager:
 
         in_initial_update = self.display_phase is None
 
-        new_phase = self.__next_display_state(
-            time_now_s, last_interaction_s, self.display_timeouts
-        )
+        timeouts = self.display_timeouts
+        new_phase = self.__next_display_state(time_now_s, last_interaction_s, timeouts)
+        self.__update_next_phase_change(time_now_s, last_interaction_s, timeouts)
 
         if new_phase == self.display_phase:
             # Avoid redundant hardware updates as this always runs in
@@ -199,7 +282,11 @@ class BacklightManager:
 
         if self.presto:
             new_backlight_brightness = self.display_brightnesses.for_phase(new_phase)
-            self.presto.set_backlight(new_backlight_brightness)
+            # Phases may share a brightness (e.g. sleep without turning
+            # the backlight off), so avoid redundant hardware updates.
+            if new_backlight_brightness != self.__pushed_backlight_brightness:
+                self.__pushed_backlight_brightness = new_backlight_brightness
+                self.presto.set_backlight(new_backlight_brightness)
 
         if self.display_phase_controls_glow_leds and self.__requested_glow_led_rgb:
             self.set_glow_leds(*self.__requested_glow_led_rgb)
@@ -208,7 +295,35 @@ class BacklightManager:
         # pylint: disable=simplifiable-if-expression
         return False if in_initial_update else True
 
+    def __update_next_phase_change(
+        self, time_now_s: int, last_interaction_s: int, timeouts: TimeoutSettings
+    ):
+        """
+        Records when the display phase will next change, assuming no
+        further interactions, so tick can skip the phase update until
+        then.
+        """
+        delta_s = time_now_s - last_interaction_s
+        next_timeout_s = None
+        # A phase changes once the time since the last interaction
+        # exceeds its timeout, those already exceeded have passed.
+        dim_timeout_s = timeouts.dim
+        if dim_timeout_s and dim_timeout_s >= delta_s:
+            next_timeout_s = dim_timeout_s
+        sleep_timeout_s = timeouts.sleep
+        if sleep_timeout_s and sleep_timeout_s >= delta_s:
+            if next_timeout_s is None or sleep_timeout_s < next_timeout_s:
+                next_timeout_s = sleep_timeout_s
+
+        if next_timeout_s is None:
+            self.__next_phase_change_s = None
+        else:
+            self.__next_phase_change_s = last_interaction_s + next_timeout_s
+        self.__phase_change_dim_s = dim_timeout_s
+        self.__phase_change_sleep_s = sleep_timeout_s
+
     @staticmethod
+    @micropython.native
     def __next_display_state(time_now_s: int, last_interaction_s: int, timeouts: TimeoutSettings):
         """
         Calculates the updated display sate phase There are three
@@ -216,23 +331,19 @@ class BacklightManager:
         touch. By default, touches that transition from a dimmed/off
         state are consumed. This can be turned off if required.
         """
-        new_display_phase = BacklightManager.DISPLAY_ON
-
+        # This runs every tick, so the phases are checked directly rather
+        # than via for_phase. A timeout of 0 means the phase is disabled.
         delta_s = time_now_s - last_interaction_s
 
-        for phase in (BacklightManager.DISPLAY_SLEEP, BacklightManager.DISPLAY_DIM):
-
-            timeout_s = timeouts.for_phase(phase)
+        sleep_timeout_s = timeouts.sleep
+        if sleep_timeout_s and delta_s > sleep_timeout_s:
+            return BacklightManager.DISPLAY_SLEEP
 
-            # If the timeout is 0, it means this mode is disabled
-            if not timeout_s:
-                continue
-
-            if delta_s > timeout_s:
-                new_display_phase = phase
-                break
+        dim_timeout_s = timeouts.dim
+        if dim_timeout_s and delta_s > dim_timeout_s:
+            return BacklightManager.DISPLAY_DIM
 
-        return new_display_phase
+        return BacklightManager.DISPLAY_ON
 
 
 class OS:
@@ -252,19 +363,36 @@ class OS:
 
     utc_offset: int = 0
 
-    #
-    # Backlight / Glow LED management
-    #
+    max_idle_ms: int = 10
+    """
+    The maximum time the run loop will sleep for when no scheduled
+    tasks are due, rather than immediately polling again. This reduces
+    wakeups, but bounds the rate at which touches are polled and tasks
+    without an execution_frequency are run. The loop never sleeps whilst
+    a touch is active. Set to 0 to disable.
+    """
 
-    backlight_manager: BacklightManager
+    slow_task_warning_ms: int | None = 100
+    """
+    Synchronous tasks that take longer than this to execute will post
+    a MSG_INFO message (once per task), as they block all other tasks,
+    including touch handling and display updates. Consider making them
+    async. Set to None to disable.
+    """
+
+    message_level: int = MSG_DEBUG
+    """
+    Messages posted with a severity below this are discarded without
+    calling any registered message handlers. Raise this (e.g. to
+    MSG_INFO) to avoid the cost of formatting and handling debug
+    messages.
+    """
 
     #
-    # Platform hardware config
+    # Backlight / Glow LED management
     #
 
-    __BUZZER_PIN = 43
-    __GLOW_LED_PIN = 33
-    __GLOW_LED_COUNT = 7
+    backlight_manager: BacklightManager
 
     __coroutine_type = None
 
@@ -275,10 +403,11 @@ class OS:
         """
 
         fn: "Callable[[],  None]"
-        execution_interval_us: int | None
         last_execution_us: int | None
-        touch_forces_execution: bool
         current_invocation: asyncio.Task = None
+        reported_slow: bool = False
+        removed: bool = False
+        _on_enqueue = None
 
         def __init__(
             self,
@@ -290,8 +419,45 @@ class OS:
             self.fn = fn
             self.__active = active
             self.last_execution_us = None
-            self.execution_interval_us = execution_interval_us
-            self.touch_forces_execution = touch_forces_execution
+            self.__execution_interval_us = execution_interval_us
+            self.__touch_forces_execution = touch_forces_execution
+
+        @property
+        def execution_interval_us(self) -> int | None:
+            """
+            The interval between executions, -1 to run every tick, or
+            None to only run when enqueued.
+            """
+            return self.__execution_interval_us
+
+        @execution_interval_us.setter
+        def execution_interval_us(self, interval_us: int | None):
+            """
+            Sets the interval between executions.
+            """
+            self.__execution_interval_us = interval_us
+            # The OS caches which tasks run every tick and when the next
+            # scheduled task is due.
+            if self._on_enqueue is not None:
+                self._on_enqueue()
+
+        @property
+        def touch_forces_execution(self) -> bool:
+            """
+            Determines if the task should be executed whenever a touch is
+            active.
+            """
+            return self.__touch_forces_execution
+
+        @touch_forces_execution.setter
+        def touch_forces_execution(self, forces_execution: bool):
+            """
+            Sets if the task should be executed whenever a touch is active.
+            """
+            self.__touch_forces_execution = forces_execution
+            # The OS caches which tasks react to touches.
+            if self._on_enqueue is not None:
+                self._on_enqueue()
 
         @property
         def active(self) -> bool:
@@ -323,15 +489,29 @@ class OS:
             # the last execution.
             # Use None, to avoid and edge cases when values wrap, etc.
             self.last_execution_us = None
+            if self._on_enqueue is not None:
+                self._on_enqueue()
 
     #
     # Internal state
     #
 
-    __message_handlers: []
+    __message_handlers: tuple
     __tasks: []
     __running = False
     __touch_was_active = False
+    __display_update_pending = False
+    __schedule_dirty = True
+    __schedule_time_us: int = 0
+    __schedule_wait_us: int | None = None
+    __every_tick_tasks: []
+    __touch_tasks: []
+    __time_now_s: int = 0
+    __create_task = None
+    __executing_tasks = False
+    __tasks_removed = False
+    __tasks_snapshot: tuple | None = None
+    __display_update_region: Region | None = None
 
     def __init__(self, *args, **kwarg) -> None:
         """
@@ -346,8 +526,12 @@ class OS:
 
         Any args/kwargs are forwarded to the Presto constructor.
         """
-        self.__message_handlers = []
+        # Held as a tuple, as they rarely change, so message_handlers
+        # can return it without a copy.
+        self.__message_handlers = ()
         self.__tasks = []
+        self.__every_tick_tasks = []
+        self.__touch_tasks = []
 
         self.presto = Presto(*args, **kwarg)
         self.display = self.presto.display
@@ -385,7 +569,9 @@ class OS:
         the run loop (@see run)
 
         Exceptions during boot will be logged to any registered message
-        handlers (@see add_message_handler).
+        handlers (@see add_message_handler). Each subsystem is initialised
+        independently, so a failure in one doesn't prevent the others from
+        being initialised. The first exception is then re-raised.
 
         :param wifi: When True, attempts to connect using secrets.py
         :param use_ntp: When True syncs the RTC to the current time
@@ -393,18 +579,17 @@ class OS:
         :param run: When True, the run loop will be started (@see run)
         :raises RuntimeError: If use_ntp is requested without wifi.
         """
-        try:
-            self.post_message("Initialising Buzzer")
-            self.buzzer = Buzzer(self.__BUZZER_PIN)
-
-            if wifi:
-                self.__setup_network(use_ntp)
-            elif use_ntp:
-                raise RuntimeError("use_ntp set without wifi")
-
-        except Exception as ex:  # pylint: disable=broad-except
+        errors = [self.__init_subsystem(self.__init_buzzer)]
+        if wifi:
+            errors.append(self.__init_subsystem(self.__init_network, use_ntp))
+        elif use_ntp:
+            ex = RuntimeError("use_ntp set without wifi")
             self.post_message(str(ex), MSG_FATAL)
-            raise ex
+            errors.append(ex)
+
+        for ex in errors:
+            if ex is not None:
+                raise ex
 
         if run:
             self.run()
@@ -427,21 +612,95 @@ class OS:
         If a task's touch_forces_execution property is True, then it's
         execution will be immediately scheduled regardless of any
         preferred execution_frequency.
+
+        When no scheduled tasks are due, the run loop sleeps until the
+        next one is, for at most max_idle_ms so touches are still polled
+        regularly. It never sleeps whilst a touch is active.
         """
         asyncio.get_event_loop().run_until_complete(self.run_async())
 
     async def run_async(self):
         """
         An async equivalent to run. It yields to the scheduler after
-        each task, in each run loop.
+        starting each async task, and at least once each run loop cycle.
 
         See the documentation for run for more general information.
+
+        Where the platform supports it (CPython 3.12+), async tasks
+        registered with the OS are started eagerly, so coroutines run
+        inline until they first suspend, avoiding a trip through the
+        scheduler for those that complete without awaiting. Other tasks
+        created on the event loop are unaffected.
+
+        The loop attempts to run tasks at their requested frequency, if
+        load is high, they may be late, but they will never be scheduled
+        faster than the indicated rate on average. A late execution
+        doesn't delay subsequent ones, so tasks keep a stable cadence.
         """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            loop = asyncio.get_event_loop()
+            self.__create_task = lambda coro: eager_task_factory(loop, coro)
+        else:
+            self.__create_task = asyncio.create_task
+
+        # The loop body is inline, and anything it uses bound locally,
+        # as this runs continuously, and calls and attribute lookups are
+        # comparatively expensive in MicroPython.
+        touch = self.presto.touch
+        poll = touch.poll
+        backlight_manager = self.backlight_manager
+        execute_tasks = self.__execute_tasks
+        flush_display_update = self.__flush_display_update
+        idle_time_ms = self.__idle_time_ms
+        # MicroPython's asyncio can sleep in integer milliseconds, avoiding
+        # a float division each time the loop idles.
+        sleep_ms = getattr(asyncio, "sleep_ms", None) or (lambda ms: asyncio.sleep(ms / 1000))
+        ticks_us = _ticks_us
+
+        # The backlight manager works in seconds. A monotonic count is
+        # derived from ticks_us rather than using time.time, which jumps
+        # when the RTC is set, and on device exceeds the small int range,
+        # so allocates on each call. The count continues from any
+        # previous run, as the backlight manager holds times from it,
+        # time spent stopped isn't counted.
+        time_now_s = self.__time_now_s
+        second_start_us = ticks_us()
+
         self.post_message("Starting tasks")
         try:
             self.__running = True
             while self.__running:
-                await self.__tick()
+                poll()
+                touch_active = touch.state
+
+                time_us = ticks_us()
+                elapsed_us = _ticks_diff(time_us, second_start_us)
+                if elapsed_us >= 1_000_000:
+                    elapsed_s = elapsed_us // 1_000_000
+                    time_now_s += elapsed_s
+                    second_start_us = _ticks_add(second_start_us, elapsed_s * 1_000_000)
+                    self.__time_now_s = time_now_s
+
+                # Update the display before anything else, so we can
+                # consume the touch event if we need to.
+                backlight_manager.tick(time_now_s, touch_active)
+
+                if backlight_manager.consuming_touch:
+                    # Don't run tasks until the touch has ended, so they
+                    # don't see it, but yield rather than blocking async
+                    # tasks. Updates they request are still shown.
+                    flush_display_update()
+                    await sleep_ms(5)
+                    continue
+
+                # Run the users tasks
+                await execute_tasks(time_us, touch_active)
+                flush_display_update()
+
+                # Yield at least once each cycle, so in-flight async tasks
+                # can progress.
+                await sleep_ms(idle_time_ms(ticks_us()))
         except Exception as ex:  # pylint: disable=broad-except
             self.post_message(str(ex), MSG_FATAL)
             raise ex
@@ -476,6 +735,46 @@ class OS:
         else:
             self.presto.presto.update(self.presto.display)
 
+    def request_display_update(self, region: Region | None = None):
+        """
+        Requests that the display is updated at the end of the current
+        run loop cycle. Requests made within a cycle are coalesced into a
+        single update of their combined bounds, so tasks drawing in the
+        same cycle only transfer pixels to the display once.
+
+        :param region: If specified, only this region needs updating.
+        """
+        if not self.__display_update_pending:
+            self.__display_update_pending = True
+            self.__display_update_region = region
+            return
+
+        pending = self.__display_update_region
+        if pending is None or region is None:
+            self.__display_update_region = None
+            return
+
+        px, py, pw, ph = pending
+        rx, ry, rw, rh = region
+        if rx >= px and ry >= py and rx + rw <= px + pw and ry + rh <= py + ph:
+            # Already covered (e.g. repeated requests for the same region)
+            return
+
+        x = min(px, rx)
+        y = min(py, ry)
+        self.__display_update_region = Region(
+            x, y, max(px + pw, rx + rw) - x, max(py + ph, ry + rh) - y
+        )
+
+    def __flush_display_update(self):
+        """
+        Performs any display update requested during the current cycle.
+        """
+        if not self.__display_update_pending:
+            return
+        self.__display_update_pending = False
+        self.update_display(self.__display_update_region)
+
     def add_message_handler(self, handler):
         """
         Adds a handler that will be called with any OS messages.
@@ -486,11 +785,41 @@ class OS:
         No checks are made to ensure the handler hasn't already been
         registered.
 
+        Handlers that keep messages (e.g. for display later) should bound
+        the number they hold, see buffered_message_handler.
+
         :param handler: A callable that will be invoked for each message.
         :type handler: Callable[[str, int], None]
         """
-        self.post_message(f"Adding message handler: {handler}", MSG_DEBUG)
-        self.__message_handlers.append(handler)
+        if self.__message_handlers and self.message_level <= MSG_DEBUG:
+            self.post_message(f"Adding message handler: {handler}", MSG_DEBUG)
+        self.__message_handlers += (handler,)
+
+    @staticmethod
+    def buffered_message_handler(maxlen: int = 64):
+        """
+        Creates a message handler that keeps the most recent messages in
+        a fixed size buffer, discarding the oldest once full. This bounds
+        memory use, and avoids re-allocating a list as messages arrive.
+
+          handler, messages = OS.buffered_message_handler(10)
+          os.add_message_handler(handler)
+          ...
+          for msg, severity in messages:
+              ...
+
+        :param maxlen: The maximum number of messages to keep.
+        :return: The handler to register, and the deque of
+          (msg, severity) tuples it appends to.
+        """
+        # MicroPython's deque only accepts positional args
+        messages = deque((), maxlen)
+        append = messages.append
+
+        def handler(msg: str, severity: int):
+            append((msg, severity))
+
+        return handler, messages
 
     def remove_message_handler(self, handler):
         """
@@ -499,14 +828,17 @@ class OS:
         :param handler: A previously registered handler.
         :type handler: Callable[[str, int], None]
         """
-        self.__message_handlers.remove(handler)
-        self.post_message(f"Removed message handler: {handler}", MSG_DEBUG)
+        handlers = list(self.__message_handlers)
+        handlers.remove(handler)
+        self.__message_handlers = tuple(handlers)
+        if self.__message_handlers and self.message_level <= MSG_DEBUG:
+            self.post_message(f"Removed message handler: {handler}", MSG_DEBUG)
 
     def message_handlers(self):
         """
         Returns a list of the currently registered message handlers.
         """
-        return tuple(self.__message_handlers)
+        return self.__message_handlers
 
     def post_message(self, msg: str, severity: int = MSG_INFO):
         """
@@ -515,7 +847,10 @@ class OS:
         :param msg: A text message, may contain multiple lines.
         :param severity: One of the OS.MSG_* severity constants.
         """
-        for i, handler in enumerate(self.__message_handlers):
+        handlers = self.__message_handlers
+        if not handlers or severity < self.message_level:
+            return
+        for i, handler in enumerate(handlers):
             # As we report fatal errors via the messaging system, we
             # don't want a faulty handler to interrupt the reporting of
             # the message.
@@ -532,6 +867,7 @@ class OS:
         execution_frequency: int | None = None,
         touch_forces_execution: bool = True,
         active: bool = True,
+        execution_interval_us: int | None = None,
     ) -> Task:
         """
         Adds a task to be run during each cycle of the run loop.
@@ -556,29 +892,48 @@ class OS:
           immediately be executed when a touch is active in the run
           loop. this allows slow-updating pages to remain responsive to
           interactions.
+        :param execution_interval_us: An alternative to
+          execution_frequency for callers that already have the interval
+          between executions (in microseconds). Must be > 0, and can't be
+          combined with execution_frequency.
         :return: A Task object representing the added task.
         """
 
-        execution_interval_us = -1
-        if execution_frequency is not None:
-            if execution_frequency < 0:
-                raise ValueError(f"execution_frequency must be >= 0 ({execution_frequency})")
-            elif execution_frequency == 0:
-                execution_interval_us = None
-            else:
-                execution_interval_us = int(1e6 // execution_frequency)
+        if execution_interval_us is not None:
+            if execution_frequency is not None:
+                raise ValueError(
+                    "execution_frequency and execution_interval_us can't both be set"
+                )
+            if execution_interval_us <= 0:
+                raise ValueError(f"execution_interval_us must be > 0 ({execution_interval_us})")
+        elif execution_frequency is None:
+            execution_interval_us = -1
+        elif execution_frequency < 0:
+            raise ValueError(f"execution_frequency must be >= 0 ({execution_frequency})")
+        elif execution_frequency == 0:
+            execution_interval_us = None
+        elif isinstance(execution_frequency, int):
+            # Integer division avoids soft-float on devices without an FPU
+            execution_interval_us = 1_000_000 // execution_frequency
+        else:
+            execution_interval_us = int(1_000_000 // execution_frequency)
 
         task = OS.Task(fn, execution_interval_us, touch_forces_execution, active=active)
+        task._on_enqueue = self.__mark_schedule_dirty  # pylint: disable=protected-access
+        self.__schedule_dirty = True
 
         if index < 0:
             self.__tasks.append(task)
         else:
             self.__tasks.insert(index, task)
+        self.__tasks_snapshot = None
 
-        self.post_message(
-            f"Added task: {fn} (index {index}, interval: {execution_interval_us})",
-            MSG_DEBUG,
-        )
+        # Avoid formatting debug messages no one will receive.
+        if self.__message_handlers and self.message_level <= MSG_DEBUG:
+            self.post_message(
+                f"Added task: {fn} (index {index}, interval: {execution_interval_us})",
+                MSG_DEBUG,
+            )
 
         return task
 
@@ -592,10 +947,37 @@ class OS:
         :type fn_or_task: Callable[[], None] or OS.Task
         """
         if isinstance(fn_or_task, self.Task):
-            self.__tasks.remove(fn_or_task)
+            if fn_or_task.removed or fn_or_task not in self.__tasks:
+                raise ValueError(f"{fn_or_task} is not a registered task")
+            fn_or_task.removed = True
         else:
-            self.__tasks = [t for t in self.__tasks if t.fn is not fn_or_task]
-        self.post_message(f"Removed task: {fn_or_task}", MSG_DEBUG)
+            for task in self.__tasks:
+                if task.fn is fn_or_task:
+                    task.removed = True
+
+        # Removed tasks are swept from the list in place, deferred until
+        # the task list isn't being iterated by the run loop.
+        self.__tasks_removed = True
+        self.__tasks_snapshot = None
+        self.__schedule_dirty = True
+        if not self.__executing_tasks:
+            self.__sweep_removed_tasks()
+
+        if self.__message_handlers and self.message_level <= MSG_DEBUG:
+            self.post_message(f"Removed task: {fn_or_task}", MSG_DEBUG)
+
+    def __sweep_removed_tasks(self):
+        """
+        Compacts the task list in place, dropping any removed tasks.
+        """
+        tasks = self.__tasks
+        count = 0
+        for task in tasks:
+            if not task.removed:
+                tasks[count] = task
+                count += 1
+        del tasks[count:]
+        self.__tasks_removed = False
 
     def tasks(self) -> [Task]:
         """
@@ -603,98 +985,257 @@ class OS:
         but add_task or remove_task should be used to modify the list
         itself.
 
+        The returned tuple is a snapshot, so it is safe to add or remove
+        tasks whilst iterating it. The same tuple is returned until tasks
+        are added or removed.
+
         :returns: A list of tasks as OS.Task instances.
         """
-        return tuple(self.__tasks)
+        if self.__tasks_snapshot is None:
+            self.__tasks_snapshot = tuple(t for t in self.__tasks if not t.removed)
+        return self.__tasks_snapshot
 
-    def __setup_network(self, use_ntp: bool):
+    def __init_subsystem(self, init_fn, *args) -> Exception | None:
         """
-        Initialises the network, and optionally updates the RTC using
-        NTP.
+        Runs a subsystem's initialisation function, logging any
+        exception.
+
+        :return: The exception raised by init_fn, if any.
         """
-        self.post_message("Connecting to WiFI")
         try:
-            self.presto.connect()
-            if use_ntp:
-                self.post_message("Setting time")
-                # We seem to get timeouts frequently
-                ntptime.timeout = 10
-                ntptime.settime()
+            init_fn(*args)
         except Exception as ex:  # pylint: disable=broad-except
             self.post_message(str(ex), MSG_FATAL)
-            raise ex
+            return ex
+        return None
 
-    async def __tick(self):
+    def __init_buzzer(self):
+        """
+        Initialises the buzzer.
         """
-        The main run loop function. Called indefinitely from run, whilst
-        self.__running is True. Call stop to, well, stop.
+        self.post_message("Initialising Buzzer")
+        self.buzzer = Buzzer(_BUZZER_PIN)
 
-        It will attempt to run tasks at their requested frequency, if
-        load is high, they may be late, but they will never be scheduled
-        faster than the indicated rate.
+    def __init_network(self, use_ntp: bool):
+        """
+        Initialises the network, and optionally updates the RTC using
+        NTP.
+        """
+        self.post_message("Connecting to WiFI")
+        self.presto.connect()
+        if use_ntp:
+            self.post_message("Setting time")
+            # We seem to get timeouts frequently
+            ntptime.timeout = 10
+            ntptime.settime()
+
+    async def __execute_tasks(self, time_us: int, touch_active: bool):
+        """
+        Runs any tasks that are pending, based on their execution
+        frequency and other triggers.
+        """
+        # We need to update after a touch has ended, so the page can update.
+        # The touch state is captured before tasks run, in case it is
+        # polled within a task.
+        touch_considered_active = touch_active or self.__touch_was_active
+        self.__touch_was_active = touch_active
+
+        # Unless a scheduled task is due, only those that run every tick
+        # (or are forced to run by a touch) need to be considered, which
+        # avoids checking every task.
+        already_run = ()
+        if not (self.__schedule_dirty or self.__scheduled_task_due(time_us)):
+            if touch_considered_active:
+                candidate_tasks = self.__touch_tasks
+            else:
+                candidate_tasks = self.__every_tick_tasks
+            for i, task in enumerate(candidate_tasks):
+                if (
+                    self.__run_task(task, time_us, touch_considered_active)
+                    and task.current_invocation
+                ):
+                    # Let the newly created async task start
+                    await asyncio.sleep(0)
+                if self.__schedule_dirty:
+                    # A task was enqueued, added or removed, so the
+                    # remainder of the task list needs checking.
+                    already_run = candidate_tasks[: i + 1]
+                    break
+            else:
+                return
 
-        This is responsible for executing all tasks, and any other
-        housekeeping required by the OS.
+        # Reset first, as tasks may enqueue others whilst running
+        self.__schedule_dirty = False
+        self.__executing_tasks = True
+        try:
+            for task in self.__tasks:
+                if task.removed or task in already_run:
+                    continue
+                if (
+                    self.__run_task(task, time_us, touch_considered_active)
+                    and task.current_invocation
+                ):
+                    # Let the newly created async task start
+                    await asyncio.sleep(0)
+        finally:
+            self.__executing_tasks = False
+
+        if self.__tasks_removed:
+            self.__sweep_removed_tasks()
+        self.__update_schedule(time_us)
+
+    @micropython.native
+    def __run_task(self, task: Task, time_us: int, touch_active: bool) -> bool:
         """
+        Dispatches the task if it should run, based on the current time
+        and its last invocation.
 
-        self.presto.touch.poll()
+        Scheduled tasks advance their last execution by their interval,
+        so that late executions don't accumulate drift, unless they were
+        run early by a touch, or have fallen more than an interval behind
+        (e.g. after a stall), in which case they restart from now.
 
-        time_us = time.ticks_us()
-        time_now_s = time.time()
+        This is called for each candidate task every run loop cycle, so
+        the checks are inline rather than in separate helpers.
 
-        # Update the display before anything else, so we can consume the
-        # touch event if we need to.
-        self.backlight_manager.tick(time_now_s)
+        :return: Whether the task was dispatched.
+        """
+        if not task.active or task.current_invocation:
+            return False
+
+        last_execution_us = task.last_execution_us
+        next_last_execution_us = time_us
+        interval_us = task.execution_interval_us
+        # Every-tick tasks are the most frequently checked
+        if interval_us != -1 and last_execution_us is not None:
+            touch_forced = touch_active and task.touch_forces_execution
+            if interval_us is None:
+                if not touch_forced:
+                    return False
+            else:
+                elapsed_us = _ticks_diff(time_us, last_execution_us)
+                if elapsed_us < interval_us:
+                    if not touch_forced:
+                        return False
+                elif elapsed_us < 2 * interval_us:
+                    next_last_execution_us = _ticks_add(last_execution_us, interval_us)
+
+        task.last_execution_us = next_last_execution_us
+        self.__dispatch(task)
+        return True
+
+    def __mark_schedule_dirty(self):
+        """
+        Ensures all tasks are considered in the next run loop cycle.
+        """
+        self.__schedule_dirty = True
 
-        # Run the users tasks
-        await self.__execute_tasks(time_us)
+    @micropython.native
+    def __scheduled_task_due(self, time_now_us: int) -> bool:
+        """
+        Determines if the earliest scheduled task is due.
+        """
+        wait_us = self.__schedule_wait_us
+        if wait_us is None:
+            return False
+        return _ticks_diff(time_now_us, self.__schedule_time_us) >= wait_us
 
-    async def __execute_tasks(self, time_us: int):
+    @micropython.native
+    def __update_schedule(self, time_us: int):
         """
-        Runs any tasks that are pending, based on their execution
-        frequency and other triggers.
+        Records the tasks that run every tick, those that run whilst a
+        touch is active, and the time until the earliest scheduled task is
+        next due.
         """
-        # We need to update after a touch has ended, so the page can update.
-        # Capture the touch state now, in case it is polled within the task.
-        touch_considered_active = self.presto.touch.state or self.__touch_was_active
-        self.__touch_was_active = self.presto.touch.state
+        every_tick_tasks = []
+        touch_tasks = []
+        wait_us = None
         for task in self.__tasks:
-            if not self.__task_should_run(task, time_us, touch_considered_active):
+            if not task.active:
+                continue
+            interval_us = task.execution_interval_us
+            if interval_us == -1:
+                every_tick_tasks.append(task)
+                touch_tasks.append(task)
+                continue
+            # In-flight scheduled tasks mark the schedule dirty on completion
+            if task.current_invocation:
                 continue
-            task.last_execution_us = time_us
-            self.__dispatch(task)
-            await asyncio.sleep(0)
+            if task.touch_forces_execution:
+                touch_tasks.append(task)
+            if task.last_execution_us is None:
+                wait_us = 0
+                continue
+            if interval_us is None:
+                continue
+            remaining_us = interval_us - _ticks_diff(time_us, task.last_execution_us)
+            if wait_us is None or remaining_us < wait_us:
+                wait_us = remaining_us
+
+        self.__every_tick_tasks = every_tick_tasks
+        self.__touch_tasks = touch_tasks
+        self.__schedule_time_us = time_us
+        self.__schedule_wait_us = wait_us
 
     def __dispatch(self, task: Task):
         """
         Executes the task function, if this is a coroutine, then adds it as an async task
         """
+        start_us = _ticks_us()
         result = task.fn()
-        if isinstance(result, self.__coroutine_type):
+        # Most tasks are synchronous and return None, so avoid the
+        # isinstance check for them.
+        if result is not None and isinstance(result, self.__coroutine_type):
             # This was an async func so we need to run it as task. We
             # wrap it so we can track whether one is still in flight to
             # avoid multiple concurrent invocations should its runtime
             # outlast the execution_frequency window.
             async def invoke():
                 await result
+                in_flight = task.current_invocation is not None
                 task.current_invocation = None
-
-            task.current_invocation = asyncio.create_task(invoke())
-
-    @staticmethod
-    def __task_should_run(task: Task, time_now_us: int, touch_active: bool) -> bool:
+                # In-flight scheduled tasks are left out of the cached
+                # schedule until they complete. Every-tick tasks are kept
+                # in it, as they would otherwise dirty it every cycle.
+                if in_flight and task.execution_interval_us != -1:
+                    self.__schedule_dirty = True
+
+            invocation = self.__create_task(invoke())
+            # Eagerly started tasks may have already completed
+            if not invocation.done():
+                task.current_invocation = invocation
+        elif self.slow_task_warning_ms is not None and not task.reported_slow:
+            duration_ms = _ticks_diff(_ticks_us(), start_us) // 1000
+            if duration_ms > self.slow_task_warning_ms:
+                task.reported_slow = True
+                self.post_message(
+                    f"Task {task.fn} blocked the run loop for {duration_ms}ms,"
+                    " consider making it async",
+                    MSG_INFO,
+                )
+
+    @micropython.native
+    def __idle_time_ms(self, time_now_us: int) -> int:
         """
-        Determines if the task should run based on the current time and
-        its last invocation.
+        Determines how long the run loop can sleep before the next
+        scheduled task is due, limited to max_idle_ms.
         """
-        if not task.active:
-            return False
-        if task.current_invocation:
-            return False
-        if touch_active and task.touch_forces_execution:
-            return True
-        if task.last_execution_us is None:
-            return True
-        if task.execution_interval_us is None:
-            return False
-        return time.ticks_diff(time_now_us, task.last_execution_us) >= task.execution_interval_us
+        # The touch state was read at the start of this cycle, the
+        # presto's state is only re-checked in case a task polled since.
+        if (
+            not self.max_idle_ms
+            or self.__touch_was_active
+            or self.__schedule_dirty
+            or self.presto.touch.state
+        ):
+            return 0
+
+        idle_us = self.max_idle_ms * 1000
+        # Tasks that run every tick don't prevent the loop sleeping.
+        if (wait_us := self.__schedule_wait_us) is not None:
+            elapsed_us = _ticks_diff(time_now_us, self.__schedule_time_us)
+            idle_us = min(idle_us, wait_us - elapsed_us)
+            if idle_us <= 0:
+                return 0
+
+        return idle_us // 1000
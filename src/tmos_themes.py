@@ -9,7 +9,7 @@ from picographics import PicoGraphics
 from picovector import Polygon
 
 from tmos import Region
-from tmos_ui import Theme, inset_region
+from tmos_ui import Theme, get_pen, inset_region
 
 
 def lerp_color(a: tuple(int), b: tuple(int), position: float) -> tuple[int]:
@@ -60,8 +60,8 @@ class ClassicTheme(Theme):
             tint_factor = 0.1
             mid_fg = lerp_color(self.foreground_pen, self.background_pen, tint_factor)
             mid_bg = lerp_color(self.foreground_pen, self.background_pen, 1.0 - tint_factor)
-            self._mid_foreground_pen = display.create_pen(*mid_fg)
-            self._mid_background_pen = display.create_pen(*mid_bg)
+            self._mid_foreground_pen = get_pen(display, mid_fg)
+            self._mid_background_pen = get_pen(display, mid_bg)
 
         super().setup(display, dpi_scale_factor)
 
@@ -20,6 +20,11 @@ from picovector import PicoVector
 
 from tmos import OS, Region, Size, MSG_WARNING, MSG_DEBUG, MSG_SEVERITY_NAMES
 
+# The real module on-device, or tmos' stand-in off-device. Decorators
+# must be written as @micropython.native for the compiler to recognise
+# them.
+from tmos import micropython
+
 
 __all__ = [
     "ClockAccessory",
@@ -31,6 +36,9 @@ __all__ = [
     "RadioButton",
     "Theme",
     "WindowManager",
+    "bounding_region",
+    "get_pen",
+    "intersect_region",
     "is_within",
     "to_screen",
 ]
@@ -98,6 +106,82 @@ def inset_region(region: Region, x_amt: int, y_amt: int = None) -> Region:
     )
 
 
+__pens = {}
+
+
+def get_pen(display: PicoGraphics, rgb: (int, int, int)) -> int:
+    """
+    Retrieves a pen for the specified color, creating one if needed.
+
+    Pens are shared for any given display/color, avoiding duplicate
+    pens (and the palette slots they may consume in some display
+    modes) when multiple themes or pages use the same color.
+
+    :param display: The display the pen is for.
+    :param rgb: The red, green and blue values of the pen (0-255).
+    :return: The display pen.
+    """
+    key = (display, rgb)
+    pen = __pens.get(key)
+    if pen is None:
+        pen = __pens[key] = display.create_pen(*rgb)
+    return pen
+
+
+def intersect_region(a: Region, b: Region) -> Region:
+    """
+    Determines the overlap of two regions.
+
+    :param a: The first region.
+    :param b: The second region.
+    :return: The region common to both a and b, the width and height will
+      be zero if the regions don't overlap.
+    """
+    x = max(a.x, b.x)
+    y = max(a.y, b.y)
+    width = min(a.x + a.width, b.x + b.width) - x
+    height = min(a.y + a.height, b.y + b.height) - y
+    return Region(x, y, max(0, width), max(0, height))
+
+
+def bounding_region(regions: [Region]) -> Region:
+    """
+    Determines the smallest region that encloses all supplied regions.
+
+    :param regions: One or more regions.
+    :return: The bounding region.
+    :raises ValueError: If no regions are supplied.
+    """
+    if not regions:
+        raise ValueError("One or more regions must be provided")
+
+    x0, y0, w, h = regions[0]
+    x1 = x0 + w
+    y1 = y0 + h
+    for r in regions[1:]:
+        x0 = min(x0, r.x)
+        y0 = min(y0, r.y)
+        x1 = max(x1, r.x + r.width)
+        y1 = max(y1, r.y + r.height)
+    return Region(x0, y0, x1 - x0, y1 - y0)
+
+
+@micropython.native
+def _write_digits(buf: bytearray, offset: int, value: int):
+    """
+    Writes the two least significant decimal digits of value into buf
+    as ASCII, starting at offset. Avoids string formatting allocations
+    for frequently updated numeric text (e.g. clocks). Compiled to
+    machine code on device.
+
+    :param buf: The buffer to write into.
+    :param offset: The index of the first (tens) digit.
+    :param value: A non-negative integer.
+    """
+    buf[offset] = 0x30 + (value // 10) % 10
+    buf[offset + 1] = 0x30 + value % 10
+
+
 class Theme:
     """
     The encapsulation of a color scheme and presentation of UI elements.
@@ -200,6 +284,11 @@ class Theme:
     The relative scale of text used in the systray.
     """
 
+    text_metrics_cache_size: int = 64
+    """
+    The maximum number of text measurements to cache. See measure_text.
+    """
+
     _pens = ("foreground_pen", "background_pen", "secondary_background_pen", "error_pen")
     """
     The names of attributes that hold pens. If any of these attributes
@@ -230,6 +319,9 @@ class Theme:
 
     __dpi_scale_factor: int = None
 
+    __text_widths: dict = None
+    __text_widths_generation: int = 0
+
     def setup(self, display: PicoGraphics, dpi_scale_factor: int):
         """
         Configures the theme for the supplied display.
@@ -246,6 +338,9 @@ class Theme:
         tuples to pens, and applies the dpi_scale_factor to relevant
         theme properties.
         """
+        # Cached text widths may not be valid for the display
+        self.__text_widths = None
+
         if self._setup_done:
             # Ensure themes can have their own transforms
             self._vector.set_transform(self._vector_transform)
@@ -269,7 +364,7 @@ class Theme:
         for attr in self._pens:
             value = getattr(self, attr)
             if isinstance(value, tuple):
-                setattr(self, attr, display.create_pen(*value))
+                setattr(self, attr, get_pen(display, value))
 
         # Scale for dpi factor
 
@@ -338,7 +433,9 @@ class Theme:
         ratio = self.text_scale(rel_scale) / self.base_font_scale
         return int(round(self.base_text_height * ratio))
 
-    def measure_text(self, display: PicoGraphics, text: str, rel_scale: float = 1) -> (int, int):
+    def measure_text(
+        self, display: PicoGraphics, text: str, rel_scale: float = 1, cache: bool = True
+    ) -> (int, int):
         """
         Approximates the bounding box for the specified text, at a scale
         relative to the themes base_font_scale.
@@ -347,23 +444,64 @@ class Theme:
         height.
 
         This method bridges PicoGraphics and PicoVectors measurement
-        methods.
+        methods. Widths are cached by font, text and scale, as the same
+        text (e.g. button titles) is often measured every time it is
+        drawn. The cache holds up to text_metrics_cache_size entries, and
+        is cleared by setup, see collect_text_metrics.
 
         :param text: The text to measure
         :param rel_scale: The scale relative to the themes base_font_scale.
+        :param cache: Set to False for text that is unlikely to be
+          measured again (e.g. messages), to avoid it displacing
+          other cached widths.
         :return: Approximate width, height of the texts bounds.
         """
-        if self._use_vector_font_rendering:
-            self._vector.set_font_size(self.text_scale(rel_scale))
-            # We ignore the height as its the bbox of the actual text,
-            # which consequently changes if you have descenders or not.
-            _, __, w, ___ = self._vector.measure_text(text)
-            w = int(w)
+        scale = self.text_scale(rel_scale)
+        key = (self.font, text, scale)
+
+        widths = self.__text_widths
+        if widths is None:
+            widths = self.__text_widths = {}
+
+        if entry := widths.get(key):
+            entry[1] = self.__text_widths_generation
+            w = entry[0]
         else:
-            w = display.measure_text(text, self.text_scale(rel_scale))
+            if self._use_vector_font_rendering:
+                self._vector.set_font_size(scale)
+                # We ignore the height as its the bbox of the actual text,
+                # which consequently changes if you have descenders or not.
+                _, __, w, ___ = self._vector.measure_text(text)
+                w = int(w)
+            else:
+                w = display.measure_text(text, scale)
+            if cache:
+                if len(widths) >= self.text_metrics_cache_size:
+                    # Prefer to keep text used since the last collection
+                    # (e.g. the current page), but never exceed the limit.
+                    self.collect_text_metrics()
+                    if len(widths) >= self.text_metrics_cache_size:
+                        widths.clear()
+                widths[key] = [w, self.__text_widths_generation]
+
         h = self.text_height(rel_scale)
         return w, h
 
+    def collect_text_metrics(self):
+        """
+        Discards any cached text measurements that haven't been used
+        since the last call to this method.
+
+        This is called by the WindowManager whenever the current page
+        changes, and by measure_text when the cache is full, so cached
+        widths are biased towards the text used by recently shown pages.
+        """
+        if cache := self.__text_widths:
+            generation = self.__text_widths_generation
+            for key in [k for k, e in cache.items() if e[1] != generation]:
+                del cache[key]
+        self.__text_widths_generation += 1
+
     def clear_display(self, display: PicoGraphics, region: Region = None, set_fg_pen: bool = True):
         """
         Clears the display using the background_pen, and re-sets
@@ -413,6 +551,27 @@ class Theme:
         else:
             display.text(text, x, y, *args, scale=self.text_scale(rel_scale), **kwargs)
 
+    def text_batch(self, display: PicoGraphics, items: [(str, int, int)], rel_scale: float = 1.0):
+        """
+        Draws multiple pieces of text at the same scale. This is
+        equivalent to calling text for each item, but font scale and
+        positioning calculations are only performed once.
+
+        :param display: The display on which to draw the text.
+        :param items: A sequence of (text, x, y) tuples.
+        :param rel_scale: Scales the themes base_font_scale by this amount.
+        """
+        scale = self.text_scale(rel_scale)
+        if self._use_vector_font_rendering:
+            vector = self._vector
+            vector.set_font_size(scale)
+            y_offset = int(self.line_spacing(rel_scale) * 0.75)
+            for text, x, y in items:
+                vector.text(text, x, y + y_offset)
+        else:
+            for text, x, y in items:
+                display.text(text, x, y, scale=scale)
+
     def centered_text(
         self,
         display: PicoGraphics,
@@ -471,7 +630,7 @@ class Theme:
             # TODO: The +1 is for a fudge for the fact that
             # we're calculating character wrap not word wrap
             # It's super inaccurate though.
-            text_width, _ = self.measure_text(display, message, rel_scale)
+            text_width, _ = self.measure_text(display, message, rel_scale, cache=False)
             num_lines = math.ceil(text_width / wrap_width)
             if num_lines > 1:
                 num_lines += 1
@@ -641,6 +800,17 @@ class Control:
         reflect its current state.
         """
 
+    @property
+    def needs_draw(self) -> bool:
+        """
+        Whether the control's appearance may have changed since it was
+        last drawn. StaticPages use this to avoid redrawing when a touch
+        hasn't changed any of their controls.
+
+        The default implementation conservatively returns True.
+        """
+        return True
+
     def _event(self, event_name: str, *args, **kwargs):
         """
         Invoke the registered callable for the named event, if one has
@@ -676,6 +846,7 @@ class _Button(Control):
     """
 
     __is_down: bool = False
+    __drawn_state: tuple = None
 
     on_button_down = None
     """
@@ -705,6 +876,19 @@ class _Button(Control):
         """
         return self.__is_down
 
+    @property
+    def needs_draw(self) -> bool:
+        """
+        Re-implemented to compare the button's state and title with
+        those used when it was last drawn by _Button.draw.
+        """
+        drawn_state = self.__drawn_state
+        return (
+            drawn_state is None
+            or drawn_state[0] != self.__is_down
+            or drawn_state[1] != self.title
+        )
+
     def set_is_down(self, is_down: bool, emit: bool = True):
         """
         Programmatically set the buttons state.
@@ -722,6 +906,7 @@ class _Button(Control):
 
     def draw(self, display: PicoGraphics, theme: Theme):
 
+        self.__drawn_state = (self.__is_down, self.title)
         theme.draw_button_frame(display, self.region, self.__is_down, self.adjoined)
         if self.title:
             theme.draw_button_title(
@@ -822,6 +1007,7 @@ class RadioButton(Control):
     _controls: [LatchingButton]
     _options: [str]
     _current_index: int = -1
+    _touch_was_inside: bool = False
 
     def __init__(
         self,
@@ -930,6 +1116,13 @@ class RadioButton(Control):
             fn(index)  # pylint: disable=not-callable
 
     def process_touch_state(self, touch):
+        # Options only need to see touches that are (or were) within the
+        # control, otherwise they are all no-ops.
+        touch_inside = touch.state and is_within(self.region, touch.x, touch.y)
+        if not touch_inside and not self._touch_was_inside:
+            return
+        self._touch_was_inside = touch_inside
+
         for control in self._controls:
             control.process_touch_state(touch)
 
@@ -937,6 +1130,13 @@ class RadioButton(Control):
         for button in self._controls:
             button.draw(display, theme)
 
+    @property
+    def needs_draw(self) -> bool:
+        for button in self._controls:
+            if button.needs_draw:
+                return True
+        return False
+
 
 class SystrayPageButton(LatchingButton):
     """
@@ -994,9 +1194,14 @@ class Page:
     """
 
     _controls: [Control]
+    _dirty_regions: [Region]
+    _setup_args: tuple = None
+    _update_requested: bool = False
+    _partial_update_requested: bool = False
 
     def __init__(self) -> None:
         self._controls = []
+        self._dirty_regions = []
 
     def setup(self, region: Region, window_manager: "WindowManager"):
         """
@@ -1041,10 +1246,111 @@ class Page:
         The default implementation ensures controls are processed prior
         to drawing, so their current state is accurately reflects the
         state of user interactivity. _draw is then called, and controls
-        are drawn on top.
-        """
+        are drawn on top. If regions have been marked dirty (see
+        mark_dirty), and they are the only reason the page was ticked,
+        drawing and the display update are restricted to them.
+        """
+        requested, self._update_requested = self._update_requested, False
+        partial, self._partial_update_requested = self._partial_update_requested, False
+        dirty_regions, self._dirty_regions = self._dirty_regions, []
+
+        # Full updates, scheduled ticks and touches (which can change
+        # the state of any control) always redraw everything.
+        if partial and dirty_regions and not requested and not window_manager.os.touch.state:
+            update_region = intersect_region(bounding_region(dirty_regions), region)
+            if update_region.width and update_region.height:
+                window_manager.display.set_clip(*update_region)
+                self._tick(region, window_manager)
+                window_manager.display.remove_clip()
+                window_manager.request_display_update(update_region)
+            return
+
         self._tick(region, window_manager)
-        window_manager.update_display(region)
+        window_manager.request_display_update(region)
+
+    def mark_dirty(self, region: Region):
+        """
+        Requests that the supplied region of the page is redrawn in the
+        next available run loop cycle.
+
+        If only dirty regions are pending when the page is next ticked,
+        drawing is clipped to their combined bounds, and only that area
+        of the display is updated. Setting needs_update, scheduled
+        ticks, touch interactions and page setup always cause the whole
+        page to be redrawn.
+
+        :param region: The screen-space region that needs redrawing.
+        """
+        self._dirty_regions.append(region)
+
+    @property
+    def update_pending(self) -> bool:
+        """
+        Whether a full redraw of the page has been requested (by
+        setting needs_update, or by the window manager), that tick has
+        yet to perform. Re-implementations of tick that only draw part
+        of the page can use this to determine if they should defer to
+        the base class implementation.
+        """
+        return self.needs_update or self._update_requested
+
+    def request_update(self):
+        """
+        Requests that the whole page is redrawn when it is next ticked.
+
+        This is used by the window manager, pages should set
+        needs_update instead.
+        """
+        self._update_requested = True
+
+    def request_partial_update(self) -> bool:
+        """
+        Requests that the regions marked dirty (see mark_dirty) are
+        redrawn when the page is next ticked.
+
+        This is used by the window manager.
+
+        :return: True if the request is new, and so the page needs to
+          be ticked. False if no regions are dirty, or an update has
+          already been requested.
+        """
+        if not self._dirty_regions or self._partial_update_requested:
+            return False
+        self._partial_update_requested = True
+        return True
+
+    def setup_required(self, region: Region, theme: Theme) -> bool:
+        """
+        Determines if setup needs to be called, either because
+        needs_setup is set, or the supplied region or theme differ from
+        those of the last setup (see mark_setup).
+
+        This is used by the window manager.
+        """
+        return self.needs_setup or self._setup_args != (region, theme)
+
+    def mark_setup(self, region: Region, theme: Theme):
+        """
+        Records that the page has been set up for the supplied region
+        and theme. Any dirty regions are discarded, and needs_update is
+        set, as the page needs a full redraw after setup.
+
+        This is used by the window manager.
+        """
+        self.needs_setup = False
+        self._setup_args = (region, theme)
+        self._dirty_regions = []
+        self.needs_update = True
+
+    def reset_setup(self):
+        """
+        Ensures the page is set up again when it is next shown, and
+        releases the references held from its last setup.
+
+        This is used by the window manager.
+        """
+        self.needs_setup = True
+        self._setup_args = None
 
     def will_hide(self):
         """
@@ -1062,13 +1368,20 @@ class Page:
 
     def _tick(self, region: Region, window_manager: "WindowManager"):
 
-        display = window_manager.display
         touch = window_manager.os.touch
-        theme = window_manager.theme
-
         for control in self._controls:
             control.process_touch_state(touch)
 
+        self._redraw(region, window_manager)
+
+    def _redraw(self, region: Region, window_manager: "WindowManager"):
+        """
+        Updates and draws the page and its controls, without processing
+        touches.
+        """
+        display = window_manager.display
+        theme = window_manager.theme
+
         self._update(window_manager.os)
         self._draw(display, region, theme)
 
@@ -1098,6 +1411,13 @@ class StaticPage(Page):
     """
     A specialisation of pages that only updates when requested (by
     setting self.needs_update), or through touch interactions.
+
+    The page is redrawn whilst a touch is active. Other ticks (e.g. the
+    one after a touch ends, or every cycle when shown modally) only
+    redraw the page if one of its controls changed state (see
+    Control.needs_draw), otherwise _update and _draw are not called.
+    Set needs_update from any code that changes other drawn state
+    outside of a touch (e.g. timers or async tasks).
     """
 
     @property
@@ -1108,6 +1428,25 @@ class StaticPage(Page):
         """
         return 0
 
+    def tick(self, region: Region, window_manager: "WindowManager"):
+        """
+        Re-implements tick to skip redrawing the page when no update was
+        requested, no touch is active and none of its controls changed.
+        """
+        touch = window_manager.os.touch
+        if self._update_requested or self._partial_update_requested or touch.state:
+            super().tick(region, window_manager)
+            return
+
+        for control in self._controls:
+            control.process_touch_state(touch)
+
+        for control in self._controls:
+            if control.needs_draw:
+                self._redraw(region, window_manager)
+                window_manager.request_display_update(region)
+                return
+
 
 class Systray(Page):
     """
@@ -1162,17 +1501,15 @@ class Systray(Page):
     __page_radio_button: RadioButton = None
 
     __leading_accessories: [Accessory]
-    __leading_accessory_regions: [Region]
     __trailing_accessories: [Accessory]
-    __trailing_accessory_regions: [Region]
+    __accessory_regions: ((Accessory, Region))
 
     def __init__(self) -> None:
         super().__init__()
         self.__pages = []
         self.__leading_accessories = []
-        self.__leading_accessory_regions = []
         self.__trailing_accessories = []
-        self.__trailing_accessory_regions = []
+        self.__accessory_regions = ()
 
     def setup(self, region: Region, window_manager: "WindowManager"):
         """
@@ -1246,6 +1583,22 @@ class Systray(Page):
         else:
             raise ValueError("Unkown accessory")
 
+        self.__accessory_regions = tuple(
+            (a, r) for a, r in self.__accessory_regions if a is not accessory
+        )
+
+    def remove_all_accessories(self):
+        """
+        Removes all accessories from the systray.
+        """
+        for accessory in self.__leading_accessories:
+            accessory.teardown()
+        for accessory in self.__trailing_accessories:
+            accessory.teardown()
+        self.__leading_accessories.clear()
+        self.__trailing_accessories.clear()
+        self.__accessory_regions = ()
+
     def accessories(self) -> (tuple[Accessory], tuple[Accessory]):
         """
         Lists the accessories currently registered with the systray.
@@ -1286,13 +1639,7 @@ class Systray(Page):
 
         theme.draw_systray(display, region, self.adjoined)
 
-        for accessory, acc_region in zip(
-            self.__leading_accessories, self.__leading_accessory_regions
-        ):
-            accessory._tick(acc_region, window_manager)
-        for accessory, acc_region in zip(
-            self.__trailing_accessories, self.__trailing_accessory_regions
-        ):
+        for accessory, acc_region in self.__accessory_regions:
             accessory._tick(acc_region, window_manager)
 
         for control in self._controls:
@@ -1302,18 +1649,22 @@ class Systray(Page):
         """
         Configures accessories, and returns the region available for the
         pager.
+
+        The accessories and their regions are stored as a flat tuple, so
+        ticks don't need to re-pair them.
         """
-        for accessory_list, region_list, trailing in (
-            (self.__leading_accessories, self.__leading_accessory_regions, False),
-            (self.__trailing_accessories, self.__trailing_accessory_regions, True),
+        accessory_regions = []
+        for accessory_list, trailing in (
+            (self.__leading_accessories, False),
+            (self.__trailing_accessories, True),
         ):
-            region_list.clear()
             if accessory_list:
-                region, accessory_regions = self.__setup_positional_accesories(
+                region, regions = self.__setup_positional_accesories(
                     region, accessory_list, window_manager, trailing=trailing
                 )
-                region_list.extend(accessory_regions)
+                accessory_regions.extend(zip(accessory_list, regions))
 
+        self.__accessory_regions = tuple(accessory_regions)
         return region
 
     def __setup_positional_accesories(
@@ -1410,7 +1761,7 @@ class WindowManager:
     __modal_page: Page = None
     __modal_page_task: OS.Task = None
     __last_page: Page = None
-    __pages_need_setup: bool = True
+    __pages_need_update: bool = True
 
     __content_region: Region
 
@@ -1463,7 +1814,7 @@ class WindowManager:
 
     def __set_content_region(self, region: Region):
         self.__content_region = region
-        self.__pages_need_setup = True
+        self.__pages_need_update = True
 
     @property
     def systray_region(self):
@@ -1539,6 +1890,13 @@ class WindowManager:
         self.__systray_page.remove_accessory(accessory)
         self.__systray_needs_setup = True
 
+    def remove_all_systray_accessories(self):
+        """
+        Removes all accessories from the systray.
+        """
+        self.__systray_page.remove_all_accessories()
+        self.__systray_needs_setup = True
+
     def systray_accessories(self) -> (tuple[Systray.Accessory], tuple[Systray.Accessory]):
         """
         Lists the accessories currently registered with the systray.
@@ -1567,7 +1925,8 @@ class WindowManager:
         """
         if theme == self.__theme:
             return
-        self.os.post_message(f"Setting theme to {theme}", MSG_DEBUG)
+        if self.os.message_level <= MSG_DEBUG:
+            self.os.post_message(f"Setting theme to {theme}", MSG_DEBUG)
         theme.setup(self.display, self.dpi_scale_factor)
         self.__theme = theme
         self.__update_regions()
@@ -1593,6 +1952,17 @@ class WindowManager:
         """
         return self.os.update_display(*args, **kwargs)
 
+    def request_display_update(self, *args, **kwargs):
+        """
+        Requests a display update at the end of the current run loop
+        cycle. See OS.request_display_update.
+
+        Pages and accessories should prefer this to update_display in
+        their tick, so that drawing in the same cycle only transfers
+        pixels to the display once.
+        """
+        return self.os.request_display_update(*args, **kwargs)
+
     def os_msg(self, msg: str, severity: int):
         """
         A handler for OS messages, currently presents them as a
@@ -1613,7 +1983,9 @@ class WindowManager:
         ]
         full_screen = Region(0, 0, *self.display.get_bounds())
         self.__theme.draw_strings(self.display, display_messages, full_screen)
-        self.update_display()
+        # Messages may be posted outside of the run loop (e.g. during
+        # boot or before a fatal exception), so update immediately.
+        self.os.update_display()
 
     def add_page(self, page: Page, make_current: bool = False):
         """
@@ -1654,6 +2026,7 @@ class WindowManager:
         self.__pages.remove(page)
         self.os.remove_task(self.__page_tasks[page])
         del self.__page_tasks[page]
+        page.reset_setup()
 
         page.teardown()
 
@@ -1816,7 +2189,14 @@ class WindowManager:
         active states of the page tasks in the run loop.
         """
 
-        if self.__modal_page:
+        if page := self.__modal_page:
+            # Modal pages are ticked every cycle, so only need to know
+            # that an update was requested.
+            if page.needs_update:
+                page.needs_update = False
+                page.request_update()
+            else:
+                page.request_partial_update()
             return
 
         # Potential flaw here is that this relies on the WM task being
@@ -1824,29 +2204,36 @@ class WindowManager:
         # but would be nice to make this stable. Worst case it the new
         # page doesn't update until the next tick...
 
-        if self.__pages_need_setup:
+        if self.__pages_need_update:
             for page in self.__pages:
-                page.needs_setup = True
                 # We could make page set this in setup, but then
                 # everyone would need to call the base class method, and
                 # they're only going to forget...
                 # We could wrap it, but then that's potentially less
                 # intuitive too for some... 🤷
                 page.needs_update = True
-            self.__pages_need_setup = False
+            self.__pages_need_update = False
 
         if page := self.__current_page:
-            if page.needs_setup:
-                page.needs_setup = False
+            # Pages only need re-laying out if their region or theme
+            # differs from that of their last setup, which isn't always
+            # the case for background pages (e.g. if the systray was
+            # hidden then shown again).
+            if page.setup_required(self.content_region, self.__theme):
                 page.setup(self.content_region, self)
-                page.needs_update = True
+                page.mark_setup(self.content_region, self.__theme)
             if page.needs_update:
                 page.needs_update = False
+                page.request_update()
+                self.__page_tasks[page].enqueue()
+            elif page.request_partial_update():
                 self.__page_tasks[page].enqueue()
 
         if self.__current_page == self.__last_page:
             return
 
+        self.__theme.collect_text_metrics()
+
         if self.__last_page:
             self.__last_page.will_hide()
 
@@ -1867,6 +2254,11 @@ class WindowManager:
         for page, task in self.__page_tasks.items():
             task.active = page is active_page
 
+        if active_page:
+            # Newly active pages need a full redraw, regardless of why
+            # they are first ticked.
+            active_page.request_update()
+
     def __create_systray(self):
         """
         Creates the systray and registers its task.
@@ -1937,14 +2329,27 @@ class WindowManager:
 class ClockAccessory(Systray.Accessory):
     """
     A very basic, badly laid out clock.
+
+    The time/date text is only re-formatted when the displayed values
+    change, digits are written into pre-allocated buffers to reduce heap
+    churn on device.
     """
 
     __os: OS = None
     __show_seconds: bool
 
+    __time_buf: bytearray
+    __date_buf: bytearray
+    __time_text: str = ""
+    __date_text: str = ""
+    __last_time: int = -1
+    __last_date: int = -1
+
     def __init__(self, show_seconds=True) -> None:
         super().__init__()
         self.__show_seconds = show_seconds
+        self.__time_buf = bytearray(b"00:00:00" if show_seconds else b"00:00")
+        self.__date_buf = bytearray(b"00/00")
 
     def size(self, max_size: Region, window_manager: WindowManager) -> Size:
         placeholder_text = "XX:XX:XX" if self.__show_seconds else "XX:XX"
@@ -1958,19 +2363,32 @@ class ClockAccessory(Systray.Accessory):
     def _draw(self, display: PicoGraphics, region: Region, theme: Theme):
         p = theme.padding
         _, month, day, hours, mins, secs, __, ___ = self.__os.localtime()
+
+        time_key = (hours * 60 + mins) * 60 + (secs if self.__show_seconds else 0)
+        if time_key != self.__last_time:
+            self.__last_time = time_key
+            buf = self.__time_buf
+            _write_digits(buf, 0, hours)
+            _write_digits(buf, 3, mins)
+            if self.__show_seconds:
+                _write_digits(buf, 6, secs)
+            self.__time_text = str(buf, "ascii")
+
+        date_key = month * 100 + day
+        if date_key != self.__last_date:
+            self.__last_date = date_key
+            _write_digits(self.__date_buf, 0, day)
+            _write_digits(self.__date_buf, 3, month)
+            self.__date_text = str(self.__date_buf, "ascii")
+
         text_height = theme.text_height()
+        x = region.x + p
+        y = region.y + region.height // 2
         display.set_pen(theme.foreground_pen)
-        theme.text(
+        theme.text_batch(
             display,
             (
-                f"{hours:02d}:{mins:02d}:{secs:02d}"
-                if self.__show_seconds
-                else f"{hours:02d}:{mins:02d}"
+                (self.__time_text, x, y - text_height - p // 4),
+                (self.__date_text, x, y + p // 4),
             ),
-            *to_screen(region, p, region.height // 2 - text_height - p // 4),
-        )
-        theme.text(
-            display,
-            f"{day:02d}/{month:02d}",
-            *to_screen(region, p, region.height // 2 + p // 4),
         )
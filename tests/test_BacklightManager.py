@@ -36,6 +36,10 @@ class Test_BacklightManager_init:
         assert bm_2.display_brightnesses.dim != bm_1.display_brightnesses.dim
         assert bm_2.glow_led_brighnesses.dim != bm_1.glow_led_brighnesses.dim
 
+    def test_default_timeouts_readable_from_class(self):
+        assert BacklightManager.TimeoutSettings.dim == 30
+        assert BacklightManager.TimeoutSettings.sleep == 600
+
 
 class Test_BacklightManager_set_glow_leds:
 
@@ -94,13 +98,49 @@ class Test_BacklightManager_set_glow_leds:
 
             mock_set.reset_mock()
 
-            expected_calls = [mock.call(i, *rgb) for i in range(bm.num_leds)]
-
             setattr(bm.glow_led_brighnesses, phase, brightness)
             bm.display_phase = phase
 
             bm.set_glow_leds(*rgb)
-            mock_set.assert_has_calls(expected_calls)
+            # The color is unaffected by the phase, so the LEDs only need
+            # setting the first time.
+            if phase == bm.DISPLAY_ON:
+                expected_calls = [mock.call(i, *rgb) for i in range(bm.num_leds)]
+                mock_set.assert_has_calls(expected_calls)
+            else:
+                mock_set.assert_not_called()
+
+    def test_when_color_unchanged_then_leds_not_set_again(self):
+
+        bm = BacklightManager()
+        bm.presto = mock.Mock()
+        bm.presto.set_led_rgb = mock.Mock()
+
+        bm.set_glow_leds(200, 100, 10)
+        bm.presto.set_led_rgb.reset_mock()
+        bm.set_glow_leds(200, 100, 10)
+        bm.presto.set_led_rgb.assert_not_called()
+
+        bm.set_glow_leds(10, 100, 200)
+        assert bm.presto.set_led_rgb.call_count == bm.num_leds
+
+    def test_when_color_and_phase_unchanged_then_brightness_not_reapplied(self):
+
+        bm = BacklightManager()
+        bm.presto = mock.Mock()
+        bm.display_phase = bm.DISPLAY_DIM
+
+        with mock.patch.object(
+            bm.glow_led_brighnesses, "for_phase", wraps=bm.glow_led_brighnesses.for_phase
+        ) as for_phase_spy:
+            bm.set_glow_leds(200, 100, 10)
+            bm.set_glow_leds(200, 100, 10)
+            for_phase_spy.assert_called_once_with(bm.DISPLAY_DIM)
+
+            bm.display_phase = bm.DISPLAY_SLEEP
+            bm.set_glow_leds(200, 100, 10)
+            for_phase_spy.assert_called_with(bm.DISPLAY_SLEEP)
+            assert for_phase_spy.call_count == 2
 
 
 class Test_BacklightManager_update_display_phase:
@@ -137,6 +177,21 @@ class Test_BacklightManager_update_display_phase:
                 bm.display_brightnesses.for_phase(expected_phase)
             )
 
+    def test_when_phase_brightness_unchanged_then_backlight_not_set(self, mock_presto_module):
+
+        bm = BacklightManager()
+        bm.presto = mock_presto_module.Presto()
+        bm.display_timeouts.dim = 10
+        bm.display_brightnesses.on = 0.5
+        bm.display_brightnesses.dim = 0.5
+
+        bm.update_display_phase(1234, 1234)
+        bm.presto.set_backlight.reset_mock()
+        bm.update_display_phase(1234, 1234 - 14)
+
+        assert bm.display_phase == bm.DISPLAY_DIM
+        bm.presto.set_backlight.assert_not_called()
+
     def test_when_dim_timeout_zero_then_phase_inactive(self):
 
         bm = BacklightManager()
@@ -216,16 +271,105 @@ class Test_BacklightManager_update_display_phase:
 
 class Test_BacklightManager_tick:
 
-    def test_when_wake_consumes_touch_then_state_false_after_update(
+    def test_when_wake_consumes_touch_then_touch_consumed_until_it_ends(
         self, mock_presto_module, monkeypatch
     ):
         self.__test_touch_handling(True, mock_presto_module, monkeypatch)
 
-    def test_when_wake_doesnt_consumes_touch_then_state_true_after_update(
+    def test_when_wake_doesnt_consumes_touch_then_touch_not_consumed(
         self, mock_presto_module, monkeypatch
     ):
         self.__test_touch_handling(False, mock_presto_module, monkeypatch)
 
+    def test_when_touch_active_supplied_then_used_over_presto_state(self, mock_presto_module):
+
+        bm = BacklightManager()
+        bm.presto = mock_presto_module.Presto()
+        bm.presto.touch.state = False
+        bm.display_timeouts.dim = 5
+        bm.display_timeouts.sleep = 0
+        bm.update_display_phase(0, -10)
+        assert bm.display_phase is bm.DISPLAY_DIM
+
+        bm.tick(100, touch_active=True)
+        assert bm.display_phase is bm.DISPLAY_ON
+        assert bm.consuming_touch is True
+
+    def test_when_timeouts_disabled_then_backlight_not_updated_after_initial_tick(
+        self, mock_presto_module
+    ):
+        bm = BacklightManager()
+        bm.presto = mock_presto_module.Presto()
+        bm.presto.touch.state = False
+        bm.display_timeouts.dim = 0
+        bm.display_timeouts.sleep = 0
+
+        bm.tick(1234)
+        assert bm.display_phase is bm.DISPLAY_ON
+        bm.presto.set_backlight.reset_mock()
+
+        bm.tick(1234 + 10000)
+        assert bm.display_phase is bm.DISPLAY_ON
+        bm.presto.set_backlight.assert_not_called()
+
+    def test_when_timeouts_enabled_after_being_disabled_then_take_effect(
+        self, mock_presto_module
+    ):
+        bm = BacklightManager()
+        bm.presto = mock_presto_module.Presto()
+        bm.presto.touch.state = False
+        bm.display_timeouts.dim = 0
+        bm.display_timeouts.sleep = 0
+
+        bm.tick(1234)
+        bm.display_timeouts.dim = 5
+        bm.tick(1234 + 10)
+        assert bm.display_phase is bm.DISPLAY_DIM
+
+    def test_when_custom_timeouts_object_assigned_then_changes_take_effect(
+        self, mock_presto_module
+    ):
+        class Timeouts:
+            dim = 0
+            sleep = 0
+
+        bm = BacklightManager()
+        bm.presto = mock_presto_module.Presto()
+        bm.presto.touch.state = False
+        bm.display_timeouts = Timeouts()
+
+        bm.tick(1234)
+        bm.display_timeouts.dim = 5
+        bm.tick(1234 + 10)
+        assert bm.display_phase is bm.DISPLAY_DIM
+
+    def test_when_no_touch_then_phase_only_updated_once_change_due(self, mock_presto_module):
+        bm = BacklightManager()
+        bm.presto = mock_presto_module.Presto()
+        bm.presto.touch.state = False
+        bm.display_timeouts.dim = 10
+        bm.display_timeouts.sleep = 20
+
+        bm.tick(1234)
+
+        with mock.patch.object(
+            bm, "update_display_phase", wraps=bm.update_display_phase
+        ) as update_spy:
+            bm.tick(1234 + 5)
+            bm.tick(1234 + 10)
+            update_spy.assert_not_called()
+
+            bm.tick(1234 + 11)
+            update_spy.assert_called_once()
+            assert bm.display_phase is bm.DISPLAY_DIM
+
+            update_spy.reset_mock()
+            bm.tick(1234 + 20)
+            update_spy.assert_not_called()
+
+            bm.tick(1234 + 21)
+            update_spy.assert_called_once()
+            assert bm.display_phase is bm.DISPLAY_SLEEP
 
     def __test_touch_handling(self, should_consume, mock_presto_module, monkeypatch):
 
@@ -283,9 +427,18 @@ class Test_BacklightManager_tick:
         time_now += 1 * 1e6
         bm.tick(time_now)
         assert bm.display_phase is bm.DISPLAY_ON
-        if should_consume:
-            bm.presto.touch.poll.assert_called_once()
-            assert bm.presto.touch.state is False
-        else:
-            bm.presto.touch.poll.assert_not_called()
-            assert bm.presto.touch.state is True
+        # The touch should never block the tick
+        bm.presto.touch.poll.assert_not_called()
+        assert bm.presto.touch.state is True
+        assert bm.consuming_touch is should_consume
+
+        # The touch continues to be consumed until it ends
+
+        time_now += 1 * 1e6
+        bm.tick(time_now)
+        assert bm.consuming_touch is should_consume
+
+        bm.presto.touch.state = False
+        time_now += 1 * 1e6
+        bm.tick(time_now)
+        assert bm.consuming_touch is False
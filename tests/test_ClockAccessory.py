@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 Tom Cowland
+
+"""
+Tests for the ClockAccessory systray accessory.
+"""
+
+from unittest import mock
+
+import pytest
+
+from tmos import OS, Region
+from tmos_ui import ClockAccessory, Theme, WindowManager
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+# pylint: disable=invalid-name, redefined-outer-name
+
+
+def drawn_text(a_theme: mock.Mock) -> [str]:
+    return [item[0] for c in a_theme.text_batch.call_args_list for item in c.args[1]]
+
+
+class Test_ClockAccessory_draw:
+
+    def test_when_drawn_then_time_and_date_zero_padded(self, a_mock_wm):
+        a_mock_wm.os.localtime.return_value = (2025, 3, 4, 5, 6, 7, 0, 0)
+        clock = ClockAccessory()
+        clock.setup(Region(0, 0, 60, 30), a_mock_wm)
+        clock._draw(a_mock_wm.display, Region(0, 0, 60, 30), a_mock_wm.theme)
+        assert drawn_text(a_mock_wm.theme) == ["05:06:07", "04/03"]
+
+    def test_when_show_seconds_false_then_seconds_omitted(self, a_mock_wm):
+        a_mock_wm.os.localtime.return_value = (2025, 12, 31, 23, 59, 7, 0, 0)
+        clock = ClockAccessory(show_seconds=False)
+        clock.setup(Region(0, 0, 60, 30), a_mock_wm)
+        clock._draw(a_mock_wm.display, Region(0, 0, 60, 30), a_mock_wm.theme)
+        assert drawn_text(a_mock_wm.theme) == ["23:59", "31/12"]
+
+    def test_when_time_unchanged_then_same_text_instance_drawn(self, a_mock_wm):
+        a_mock_wm.os.localtime.return_value = (2025, 3, 4, 5, 6, 7, 0, 0)
+        clock = ClockAccessory()
+        clock.setup(Region(0, 0, 60, 30), a_mock_wm)
+        clock._draw(a_mock_wm.display, Region(0, 0, 60, 30), a_mock_wm.theme)
+        clock._draw(a_mock_wm.display, Region(0, 0, 60, 30), a_mock_wm.theme)
+        first_time, first_date, second_time, second_date = drawn_text(a_mock_wm.theme)
+        assert second_time is first_time
+        assert second_date is first_date
+
+    def test_when_time_changes_then_text_updated(self, a_mock_wm):
+        a_mock_wm.os.localtime.return_value = (2025, 3, 4, 5, 6, 7, 0, 0)
+        clock = ClockAccessory()
+        clock.setup(Region(0, 0, 60, 30), a_mock_wm)
+        clock._draw(a_mock_wm.display, Region(0, 0, 60, 30), a_mock_wm.theme)
+        a_mock_wm.os.localtime.return_value = (2025, 3, 5, 10, 0, 0, 0, 0)
+        clock._draw(a_mock_wm.display, Region(0, 0, 60, 30), a_mock_wm.theme)
+        assert drawn_text(a_mock_wm.theme)[2:] == ["10:00:00", "05/03"]
+
+
+@pytest.fixture
+def a_mock_wm():
+    m = mock.create_autospec(WindowManager, instance=True)
+    m.os = mock.create_autospec(OS, instance=True)
+    m.display = mock.Mock()
+    m.theme = mock.create_autospec(Theme, instance=True)
+    m.theme.padding = 5
+    m.theme.foreground_pen = 1
+    m.theme.text_height.return_value = 8
+    return m
@@ -15,7 +15,7 @@ from unittest import mock
 
 import pytest
 
-from tmos import OS, Region, MSG_FATAL, MSG_WARNING, MSG_INFO, MSG_DEBUG
+from tmos import OS, BacklightManager, Region, MSG_FATAL, MSG_WARNING, MSG_INFO, MSG_DEBUG
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
 # pylint: disable=invalid-name
@@ -90,6 +90,15 @@ class Test_OS_boot:
         with pytest.raises(RuntimeError):
             os_instance.boot(wifi=False, use_ntp=True)
 
+    def test_when_called_with_wifi_false_and_use_ntp_true_then_buzzer_initialised_first(
+        self, mock_presto_module
+    ):
+        os_instance = OS()
+        mock_presto_module.Buzzer.reset_mock()
+        with pytest.raises(RuntimeError):
+            os_instance.boot(wifi=False, use_ntp=True)
+        mock_presto_module.Buzzer.assert_called_once()
+
     def test_when_called_with_run_then_run_loop_started(self):
 
         os_instance = OS()
@@ -127,6 +136,23 @@ class Test_OS_boot:
 
         mock_handler.assert_called_with(str(test_exception), MSG_FATAL)
 
+    def test_when_buzzer_init_fails_then_network_still_initialized(
+        self, mock_presto_module, monkeypatch
+    ):
+        test_exception = ValueError("test")
+        monkeypatch.setattr(mock_presto_module.Buzzer, "side_effect", test_exception)
+
+        os_instance = OS()
+
+        mock_handler = mock.MagicMock()
+        os_instance.add_message_handler(mock_handler)
+
+        with pytest.raises(ValueError, match=str(test_exception)):
+            os_instance.boot(wifi=True)
+
+        mock_presto_module.Presto.return_value.connect.assert_called_once()
+        mock_handler.assert_any_call(str(test_exception), MSG_FATAL)
+
 
 class Test_OS_messageHandlers:
 
@@ -212,6 +238,14 @@ class Test_OS_messageHandlers:
 
         assert calls == [2]
 
+    def test_when_handlers_unchanged_then_same_tuple_returned(self):
+
+        os_instance = OS()
+        os_instance.add_message_handler(mock.MagicMock())
+
+        handlers = os_instance.message_handlers()
+        assert os_instance.message_handlers() is handlers
+
     def test_when_no_severity_supplied_to_post_message_then_info_is_used(self):
 
         os_instance = OS()
@@ -223,6 +257,44 @@ class Test_OS_messageHandlers:
 
         mock_handler.assert_called_once_with("msg", MSG_INFO)
 
+    def test_when_no_handlers_then_debug_messages_not_posted(self):
+
+        os_instance = OS()
+
+        with mock.patch.object(os_instance, "post_message") as mock_post:
+            task = os_instance.add_task(lambda: None)
+            os_instance.remove_task(task)
+
+        mock_post.assert_not_called()
+
+    def test_when_buffered_handler_full_then_oldest_messages_discarded(self):
+
+        os_instance = OS()
+        handler, messages = OS.buffered_message_handler(2)
+        os_instance.add_message_handler(handler)
+
+        for i in range(3):
+            os_instance.post_message(f"msg {i}", MSG_INFO)
+
+        assert list(messages) == [("msg 1", MSG_INFO), ("msg 2", MSG_INFO)]
+
+    def test_when_message_level_set_then_lower_severities_discarded(self):
+
+        os_instance = OS()
+        os_instance.message_level = MSG_WARNING
+
+        mock_handler = mock.MagicMock()
+        os_instance.add_message_handler(mock_handler)
+
+        for severity in (MSG_DEBUG, MSG_INFO, MSG_WARNING, MSG_FATAL):
+            os_instance.post_message("msg", severity)
+        os_instance.add_task(lambda: None)
+
+        assert mock_handler.call_args_list == [
+            mock.call("msg", MSG_WARNING),
+            mock.call("msg", MSG_FATAL),
+        ]
+
 
 class Test_OS_run:
 
@@ -438,6 +510,18 @@ class Test_OS_tasks:
         tasks[0].execution_interval_us = new_interval
         assert os_instance.tasks()[0].execution_interval_us == new_interval
 
+    def test_when_tasks_unchanged_then_same_tuple_returned(self):
+
+        os_instance = OS()
+        os_instance.add_task(mock.Mock())
+
+        tasks = os_instance.tasks()
+        assert os_instance.tasks() is tasks
+
+        task = os_instance.add_task(mock.Mock())
+        assert os_instance.tasks() is not tasks
+        assert os_instance.tasks() == (*tasks, task)
+
 
 class Test_OS_run_execution_frequency:
 
@@ -458,14 +542,34 @@ class Test_OS_run_execution_frequency:
         self,
     ):
 
-        frequency = 4
-        expected_interval_us = 1e6 // 4
-
         os_instance = OS()
         mock_task = mock.Mock()
-        task = os_instance.add_task(mock_task, execution_frequency=frequency)
 
-        assert task.execution_interval_us == expected_interval_us
+        for frequency, expected_interval_us in ((4, 250_000), (0.5, 2_000_000)):
+            task = os_instance.add_task(mock_task, execution_frequency=frequency)
+            assert task.execution_interval_us == expected_interval_us
+            assert isinstance(task.execution_interval_us, int)
+
+    def test_when_task_added_with_execution_interval_us_then_interval_used(self):
+
+        os_instance = OS()
+        task = os_instance.add_task(mock.Mock(), execution_interval_us=12345)
+
+        assert task.execution_interval_us == 12345
+
+    def test_when_task_added_with_invalid_execution_interval_us_then_ValueError_raised(
+        self,
+    ):
+
+        os_instance = OS()
+
+        for kwargs in (
+            {"execution_interval_us": 0},
+            {"execution_interval_us": -1},
+            {"execution_interval_us": 1000, "execution_frequency": 1},
+        ):
+            with pytest.raises(ValueError):
+                os_instance.add_task(mock.Mock(), **kwargs)
 
     def test_when_task_added_with_execution_frequency_zero_then_interval_is_none(self):
 
@@ -513,8 +617,9 @@ class Test_OS_run_execution_frequency:
 
         os_instance.run()
 
-        # Check the last run entry is close enough to the call time we logged
-        assert abs(task.last_execution_us - call_times[-1]) < 100
+        # Check the last run entry is the scheduled time, at or shortly
+        # before the call time we logged.
+        assert 0 <= call_times[-1] - task.last_execution_us < expected_interval_us
         # Check call intervals are close enough
         self.__check_intervals(call_times, expected_interval_us, 0.1)
 
@@ -587,8 +692,9 @@ class Test_OS_run_execution_frequency:
 
         os_instance.run()
 
-        # Check the last run entry is close enough to the call time we logged
-        assert abs(task.last_execution_us - call_times[-1]) < 100
+        # Check the last run entry is the scheduled time, at or shortly
+        # before the call time we logged.
+        assert 0 <= call_times[-1] - task.last_execution_us < expected_interval_us
 
         # Note: there is an additional call immediately after touch is
         # false ,to allow UIs to update. As such there will be
@@ -757,6 +863,523 @@ class Test_async_tasks:
         # been called.
         assert len(calls) > 1
 
+    @pytest.mark.skipif(
+        not hasattr(asyncio, "eager_task_factory"), reason="Requires eager task support"
+    )
+    def test_when_async_task_completes_eagerly_then_is_run_again(self):
+
+        os_instance = OS()
+
+        calls = []
+
+        async def no_suspend():
+            calls.append(True)
+            if len(calls) == 3:
+                os_instance.stop()
+
+        os_instance.add_task(no_suspend)
+        # This would hang if the task was considered in-flight
+        os_instance.run()
+        assert len(calls) == 3
+
+    def test_when_eager_tasks_supported_then_only_os_tasks_started_eagerly(self, monkeypatch):
+
+        loop = asyncio.new_event_loop()
+        monkeypatch.setattr(asyncio, "get_event_loop", lambda: loop)
+
+        eager_tasks = []
+
+        def eager_task_factory(task_loop, coro):
+            task = task_loop.create_task(coro)
+            eager_tasks.append(task)
+            return task
+
+        monkeypatch.setattr(asyncio, "eager_task_factory", eager_task_factory, raising=False)
+
+        os_instance = OS()
+
+        async def stop():
+            os_instance.stop()
+
+        os_instance.add_task(stop)
+        try:
+            os_instance.run()
+        finally:
+            loop.close()
+
+        assert len(eager_tasks) == 1
+        assert loop.get_task_factory() is None
+
+
+class Test_OS_idle:
+
+    @staticmethod
+    def count_ticks(os_instance: OS, duration_s: float) -> int:
+
+        calls = []
+        start = time.monotonic()
+
+        def task():
+            calls.append(True)
+            if time.monotonic() - start > duration_s:
+                os_instance.stop()
+
+        os_instance.add_task(task)
+        os_instance.run()
+        return len(calls)
+
+    def test_when_no_tasks_due_then_run_loop_sleeps_up_to_max_idle_ms(self):
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 20
+        # 0.1s at 20ms a tick would be ~5 calls
+        assert self.count_ticks(os_instance, 0.1) < 10
+
+    def test_when_max_idle_ms_is_zero_then_run_loop_does_not_sleep(self):
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+        assert self.count_ticks(os_instance, 0.1) > 100
+
+    def test_when_touch_active_then_run_loop_does_not_sleep(self):
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 20
+        os_instance.presto.touch.state = True
+        try:
+            assert self.count_ticks(os_instance, 0.1) > 100
+        finally:
+            os_instance.presto.touch.state = False
+
+    def test_when_scheduled_task_due_before_max_idle_ms_then_not_delayed(self):
+
+        frequency = 50
+        num_calls = 5
+        call_times = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 1000
+
+        def task():
+            call_times.append(time.ticks_us())
+            if len(call_times) == num_calls:
+                os_instance.stop()
+
+        os_instance.add_task(task, execution_frequency=frequency)
+        os_instance.run()
+
+        elapsed_us = call_times[-1] - call_times[0]
+        expected_us = (num_calls - 1) * 1e6 / frequency
+        assert elapsed_us < expected_us * 1.5
+
+
+class Test_OS_schedule:
+
+    def test_when_async_every_tick_task_completes_then_schedule_not_rebuilt(self, monkeypatch):
+
+        ticks = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+
+        update_schedule = os_instance._OS__update_schedule
+        update_schedule_calls = []
+
+        def counting_update_schedule(*args):
+            update_schedule_calls.append(True)
+            update_schedule(*args)
+
+        monkeypatch.setattr(os_instance, "_OS__update_schedule", counting_update_schedule)
+
+        async def every_tick_async():
+            await asyncio.sleep(0)
+
+        def every_tick():
+            ticks.append(True)
+            if len(ticks) == 20:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick_async)
+        os_instance.add_task(every_tick)
+        os_instance.run()
+
+        assert len(ticks) == 20
+        assert len(update_schedule_calls) < 5
+
+    def test_when_task_enqueued_by_every_tick_task_then_run(self):
+
+        calls = []
+        ticks = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+        task = os_instance.add_task(lambda: calls.append(len(ticks)), execution_frequency=0)
+
+        def every_tick():
+            ticks.append(True)
+            if len(ticks) == 5:
+                task.enqueue()
+            elif len(ticks) == 7:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick, index=0)
+        os_instance.run()
+
+        assert calls == [1, 5]
+
+    def test_when_every_tick_task_removed_then_no_longer_run(self):
+
+        calls = []
+        ticks = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+
+        def removed():
+            calls.append(True)
+
+        def every_tick():
+            ticks.append(True)
+            if len(ticks) == 3:
+                os_instance.remove_task(removed)
+            elif len(ticks) == 6:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick)
+        os_instance.add_task(removed)
+        os_instance.run()
+
+        assert len(calls) == 2
+
+    def test_when_earlier_task_removed_whilst_running_then_later_tasks_still_run(self):
+
+        calls = []
+
+        os_instance = OS()
+        removed = os_instance.add_task(lambda: calls.append("removed"))
+
+        def remover():
+            calls.append("remover")
+            os_instance.remove_task(removed)
+
+        os_instance.add_task(remover)
+        os_instance.add_task(lambda: calls.append("later"))
+        os_instance.add_task(os_instance.stop)
+        os_instance.run()
+
+        assert calls == ["removed", "remover", "later"]
+        assert removed not in os_instance.tasks()
+
+    def test_when_removed_task_removed_again_then_raises(self):
+
+        os_instance = OS()
+        task = os_instance.add_task(lambda: None)
+        os_instance.remove_task(task)
+        with pytest.raises(ValueError):
+            os_instance.remove_task(task)
+
+    def test_when_touch_active_then_only_touch_forced_tasks_run(self):
+
+        ticks = []
+        touch_calls = []
+        no_touch_calls = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+
+        def every_tick():
+            ticks.append(True)
+            if len(ticks) == 5:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick)
+        os_instance.add_task(lambda: touch_calls.append(True), execution_frequency=0)
+        os_instance.add_task(
+            lambda: no_touch_calls.append(True),
+            execution_frequency=0,
+            touch_forces_execution=False,
+        )
+
+        os_instance.presto.touch.state = True
+        try:
+            os_instance.run()
+        finally:
+            os_instance.presto.touch.state = False
+
+        assert len(touch_calls) == 5
+        assert len(no_touch_calls) == 1
+
+    def test_when_execution_interval_changed_then_takes_effect(self):
+
+        ticks = []
+        calls = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+
+        def every_tick():
+            ticks.append(True)
+            if len(ticks) == 2:
+                task.execution_interval_us = 1
+            elif len(ticks) == 5:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick)
+        task = os_instance.add_task(lambda: calls.append(len(ticks)), execution_frequency=0)
+        os_instance.run()
+
+        assert calls == [1, 2, 3, 4, 5]
+
+    def test_when_touch_forces_execution_set_then_task_run_during_touch(self):
+
+        ticks = []
+        calls = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+
+        def every_tick():
+            ticks.append(True)
+            if len(ticks) == 2:
+                task.touch_forces_execution = True
+            elif len(ticks) == 5:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick)
+        task = os_instance.add_task(
+            lambda: calls.append(len(ticks)),
+            execution_frequency=0,
+            touch_forces_execution=False,
+        )
+
+        os_instance.presto.touch.state = True
+        try:
+            os_instance.run()
+        finally:
+            os_instance.presto.touch.state = False
+
+        assert calls == [1, 2, 3, 4, 5]
+
+    def test_when_task_runs_late_then_schedule_does_not_drift(self, monkeypatch):
+
+        now_us = [0]
+        monkeypatch.setattr("tmos._ticks_us", lambda: now_us[0])
+
+        calls = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+
+        def every_tick():
+            now_us[0] += 40_000
+            if now_us[0] > 480_000:
+                os_instance.stop()
+
+        os_instance.add_task(lambda: calls.append(now_us[0]), execution_frequency=10)
+        os_instance.add_task(every_tick)
+        os_instance.run()
+
+        # Ticks every 40ms, a 100ms interval from 0 should run at the first
+        # tick after each 100ms boundary.
+        assert calls == [0, 120_000, 200_000, 320_000, 400_000]
+
+    def test_when_task_falls_behind_then_schedule_restarts(self, monkeypatch):
+
+        now_us = [0]
+        monkeypatch.setattr("tmos._ticks_us", lambda: now_us[0])
+
+        calls = []
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+
+        def every_tick():
+            now_us[0] += 250_000 if len(calls) == 1 else 40_000
+            if now_us[0] > 500_000:
+                os_instance.stop()
+
+        os_instance.add_task(lambda: calls.append(now_us[0]), execution_frequency=10)
+        os_instance.add_task(every_tick)
+        os_instance.run()
+
+        # The stall means it is more than an interval behind, so it
+        # shouldn't then run on consecutive ticks to catch up.
+        assert calls == [0, 250_000, 370_000, 450_000]
+
+
+class Test_OS_backlight:
+
+    def test_when_running_then_backlight_timeouts_use_ticks(self, monkeypatch):
+
+        now_us = [0]
+        monkeypatch.setattr("tmos._ticks_us", lambda: now_us[0])
+        # Jumps in the RTC (e.g. from NTP) shouldn't affect the timeouts
+        monkeypatch.setattr(time, "time", lambda: 10_000 * now_us[0])
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+        os_instance.backlight_manager.display_timeouts.dim = 2
+        os_instance.backlight_manager.display_timeouts.sleep = 0
+
+        phases = []
+
+        def every_tick():
+            phases.append(os_instance.backlight_manager.display_phase)
+            now_us[0] += 600_000
+            if len(phases) == 6:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick)
+        os_instance.run()
+
+        # Ticks are 0.6s apart, so the whole seconds elapsed are 0, 0, 1,
+        # 1, 2, 3. Dim happens once more than 2s have elapsed.
+        assert phases == [BacklightManager.DISPLAY_ON] * 5 + [BacklightManager.DISPLAY_DIM]
+
+    def test_when_run_again_then_backlight_time_continues(self, monkeypatch):
+
+        now_us = [0]
+        monkeypatch.setattr("tmos._ticks_us", lambda: now_us[0])
+
+        os_instance = OS()
+        os_instance.max_idle_ms = 0
+        os_instance.backlight_manager.display_timeouts.dim = 10
+        os_instance.backlight_manager.display_timeouts.sleep = 0
+
+        phases = []
+        num_ticks = [6]
+
+        def every_tick():
+            phases.append(os_instance.backlight_manager.display_phase)
+            now_us[0] += 1_000_000
+            if len(phases) == num_ticks[0]:
+                os_instance.stop()
+
+        os_instance.add_task(every_tick)
+        os_instance.run()
+        assert phases == [BacklightManager.DISPLAY_ON] * 6
+
+        phases.clear()
+        num_ticks[0] = 7
+        os_instance.run()
+
+        # 5s elapsed in the first run, so the display dims once more
+        # than 10s have elapsed in total.
+        assert phases == [BacklightManager.DISPLAY_ON] * 6 + [BacklightManager.DISPLAY_DIM]
+
+
+class Test_OS_consumed_touches:
+
+    def test_when_touch_consumed_then_tasks_not_run_until_it_ends(self):
+
+        os_instance = OS()
+        os_instance.backlight_manager.presto = os_instance.presto
+        os_instance.backlight_manager.display_timeouts.dim = 5
+        os_instance.backlight_manager.display_timeouts.sleep = 0
+
+        ticks = []
+        touch_states = []
+
+        def task():
+            touch_states.append(os_instance.presto.touch.state)
+            if len(touch_states) == 2:
+                os_instance.stop()
+
+        def end_touch():
+            ticks.append(True)
+            if len(ticks) == 3:
+                os_instance.presto.touch.state = False
+
+        os_instance.add_task(task)
+        os_instance.presto.touch.poll.side_effect = end_touch
+        try:
+            # Start dimmed, so the touch wakes the display
+            os_instance.backlight_manager.update_display_phase(0, -10)
+            os_instance.presto.touch.state = True
+            os_instance.run()
+        finally:
+            os_instance.presto.touch.poll.side_effect = None
+            os_instance.presto.touch.state = False
+
+        assert len(ticks) > 3
+        assert touch_states == [False, False]
+
+    def test_when_touch_consumed_then_requested_display_updates_still_flushed(self):
+
+        os_instance = OS()
+        os_instance.backlight_manager.presto = os_instance.presto
+        os_instance.backlight_manager.display_timeouts.dim = 5
+        os_instance.backlight_manager.display_timeouts.sleep = 0
+
+        presto = os_instance.presto.presto
+        ticks = []
+        updates_during_touch = []
+
+        def poll():
+            ticks.append(True)
+            if len(ticks) == 2:
+                # e.g. from an in-flight async task
+                os_instance.request_display_update()
+            elif len(ticks) == 4:
+                updates_during_touch.append(presto.update.call_count)
+                os_instance.presto.touch.state = False
+                os_instance.stop()
+
+        os_instance.presto.touch.poll.side_effect = poll
+        try:
+            os_instance.backlight_manager.update_display_phase(0, -10)
+            os_instance.presto.touch.state = True
+            presto.update.reset_mock()
+            os_instance.run()
+        finally:
+            os_instance.presto.touch.poll.side_effect = None
+            os_instance.presto.touch.state = False
+
+        assert updates_during_touch == [1]
+
+
+class Test_OS_slow_tasks:
+
+    def test_when_sync_task_exceeds_threshold_then_message_posted_once(self):
+
+        os_instance = OS()
+        os_instance.slow_task_warning_ms = 5
+
+        messages = []
+        os_instance.add_message_handler(lambda m, s: messages.append((m, s)))
+
+        calls = []
+
+        def slow():
+            calls.append(True)
+            time.sleep(0.01)
+            if len(calls) == 3:
+                os_instance.stop()
+
+        os_instance.add_task(slow)
+        os_instance.run()
+
+        slow_messages = [m for m in messages if "blocked the run loop" in m[0]]
+        assert len(slow_messages) == 1
+        assert slow_messages[0][1] == MSG_INFO
+
+    def test_when_threshold_is_none_then_no_message_posted(self):
+
+        os_instance = OS()
+        os_instance.slow_task_warning_ms = None
+
+        messages = []
+        os_instance.add_message_handler(lambda m, s: messages.append(m))
+
+        def slow():
+            time.sleep(0.01)
+            os_instance.stop()
+
+        os_instance.add_task(slow)
+        os_instance.run()
+
+        assert not [m for m in messages if "blocked the run loop" in m]
+
 
 class Test_OS_update_display:
 
@@ -784,6 +1407,87 @@ class Test_OS_update_display:
         os_instance.presto.touch.state = False
 
 
+class Test_OS_request_display_update:
+
+    def test_when_requested_then_updated_once_at_end_of_cycle(self):
+
+        os_instance = OS()
+        os_instance.presto.presto.update.reset_mock()
+
+        def draw():
+            os_instance.request_display_update()
+            os_instance.request_display_update()
+            os_instance.presto.presto.update.assert_not_called()
+
+        os_instance.add_task(draw)
+        os_instance.add_task(os_instance.stop)
+        os_instance.run()
+
+        os_instance.presto.presto.update.assert_called_once_with(os_instance.presto.display)
+
+    def test_when_regions_requested_then_bounds_updated(self):
+
+        os_instance = OS()
+        os_instance.presto.presto.partial_update.reset_mock()
+
+        def draw():
+            os_instance.request_display_update(Region(10, 20, 5, 5))
+            os_instance.request_display_update(Region(0, 0, 5, 5))
+
+        os_instance.add_task(draw)
+        os_instance.add_task(os_instance.stop)
+        os_instance.run()
+
+        os_instance.presto.presto.partial_update.assert_called_once_with(
+            os_instance.presto.display, 0, 0, 15, 25
+        )
+
+    def test_when_contained_region_requested_then_bounds_unchanged(self):
+
+        os_instance = OS()
+        os_instance.presto.presto.partial_update.reset_mock()
+
+        def draw():
+            os_instance.request_display_update(Region(0, 0, 20, 20))
+            os_instance.request_display_update(Region(5, 5, 10, 10))
+            os_instance.request_display_update(Region(0, 0, 20, 20))
+
+        os_instance.add_task(draw)
+        os_instance.add_task(os_instance.stop)
+        os_instance.run()
+
+        os_instance.presto.presto.partial_update.assert_called_once_with(
+            os_instance.presto.display, 0, 0, 20, 20
+        )
+
+    def test_when_region_and_full_update_requested_then_full_update(self):
+
+        os_instance = OS()
+        os_instance.presto.presto.update.reset_mock()
+        os_instance.presto.presto.partial_update.reset_mock()
+
+        def draw():
+            os_instance.request_display_update(Region(10, 20, 5, 5))
+            os_instance.request_display_update()
+
+        os_instance.add_task(draw)
+        os_instance.add_task(os_instance.stop)
+        os_instance.run()
+
+        os_instance.presto.presto.partial_update.assert_not_called()
+        os_instance.presto.presto.update.assert_called_once_with(os_instance.presto.display)
+
+    def test_when_nothing_requested_then_display_not_updated(self):
+
+        os_instance = OS()
+        os_instance.presto.presto.update.reset_mock()
+
+        os_instance.add_task(os_instance.stop)
+        os_instance.run()
+
+        os_instance.presto.presto.update.assert_not_called()
+
+
 class Test_OS_utc_offset:
 
     def test_when_constructed_then_defaults_to_zero_offset(self):
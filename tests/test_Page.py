@@ -10,8 +10,10 @@ import weakref
 
 from unittest import mock
 
+import pytest
+
 from tmos import OS, Region
-from tmos_ui import Page, WindowManager
+from tmos_ui import MomentaryButton, Page, StaticPage, WindowManager
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
 # pylint: disable=invalid-name, redefined-outer-name
@@ -89,3 +91,249 @@ class Test_Page:
             mock.call.proxy_page__draw(a_wm.display, a_region, a_wm.theme),
             mock.call.draw(a_wm.display, a_wm.theme),
         ]
+
+
+class Test_Page_mark_dirty:
+
+    def test_when_called_then_region_recorded_without_full_update(self):
+        p = Page()
+        p.mark_dirty(Region(0, 0, 1, 1))
+        assert p._dirty_regions == [Region(0, 0, 1, 1)]
+        assert p.needs_update is False
+
+    def test_when_regions_dirty_then_tick_clipped_to_and_updates_bounds(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+
+        p = Page()
+        p.mark_dirty(Region(10, 10, 5, 5))
+        p.mark_dirty(Region(20, 20, 5, 5))
+        p.request_partial_update()
+        p.tick(a_region, a_wm)
+
+        a_wm.display.set_clip.assert_called_once_with(10, 10, 15, 15)
+        a_wm.display.remove_clip.assert_called_once()
+        a_wm.request_display_update.assert_called_once_with(Region(10, 10, 15, 15))
+
+    def test_when_dirty_regions_outside_page_then_clamped_to_page(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+
+        p = Page()
+        p.mark_dirty(Region(90, 90, 20, 20))
+        p.request_partial_update()
+        p.tick(a_region, a_wm)
+
+        a_wm.request_display_update.assert_called_once_with(Region(90, 90, 10, 10))
+
+    def test_when_touch_active_then_dirty_regions_ignored(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+        a_wm.os.touch.state = True
+
+        p = Page()
+        p.mark_dirty(Region(10, 10, 5, 5))
+        p.request_partial_update()
+        p.tick(a_region, a_wm)
+
+        a_wm.display.set_clip.assert_not_called()
+        a_wm.request_display_update.assert_called_once_with(a_region)
+
+    def test_when_full_update_requested_then_dirty_regions_ignored(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+
+        p = Page()
+        p.mark_dirty(Region(10, 10, 5, 5))
+        p.request_partial_update()
+        p.request_update()
+        p.tick(a_region, a_wm)
+
+        a_wm.display.set_clip.assert_not_called()
+        a_wm.request_display_update.assert_called_once_with(a_region)
+
+    def test_when_scheduled_tick_with_dirty_regions_then_fully_redrawn(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+
+        p = Page()
+        p.mark_dirty(Region(10, 10, 5, 5))
+        p.tick(a_region, a_wm)
+
+        a_wm.display.set_clip.assert_not_called()
+        a_wm.request_display_update.assert_called_once_with(a_region)
+
+    def test_when_ticked_then_dirty_regions_consumed(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+
+        p = Page()
+        p.mark_dirty(Region(10, 10, 5, 5))
+        p.request_partial_update()
+        p.tick(a_region, a_wm)
+        a_wm.reset_mock()
+        p.tick(a_region, a_wm)
+
+        a_wm.request_display_update.assert_called_once_with(a_region)
+
+
+class Test_Page_update_pending:
+
+    def test_when_needs_update_then_pending(self):
+        p = Page()
+        p.needs_update = True
+        assert p.update_pending is True
+
+    def test_when_update_requested_then_pending_until_ticked(self, a_wm):
+        p = Page()
+        assert p.update_pending is False
+        p.request_update()
+        assert p.update_pending is True
+        p.tick(Region(0, 0, 1, 1), a_wm)
+        assert p.update_pending is False
+
+
+class Test_Page_request_partial_update:
+
+    def test_when_no_regions_dirty_then_not_requested(self):
+        p = Page()
+        assert p.request_partial_update() is False
+
+    def test_when_regions_dirty_then_only_requested_once(self):
+        p = Page()
+        p.mark_dirty(Region(0, 0, 1, 1))
+        assert p.request_partial_update() is True
+        assert p.request_partial_update() is False
+
+
+class Test_Page_setup_required:
+
+    def test_when_not_setup_then_required(self):
+        assert Page().setup_required(Region(0, 0, 1, 1), mock.sentinel.theme) is True
+
+    def test_when_setup_with_same_args_then_not_required(self):
+        p = Page()
+        p.mark_setup(Region(0, 0, 1, 1), mock.sentinel.theme)
+        assert p.setup_required(Region(0, 0, 1, 1), mock.sentinel.theme) is False
+
+    def test_when_region_or_theme_changed_then_required(self):
+        p = Page()
+        p.mark_setup(Region(0, 0, 1, 1), mock.sentinel.theme)
+        assert p.setup_required(Region(0, 0, 2, 2), mock.sentinel.theme) is True
+        assert p.setup_required(Region(0, 0, 1, 1), mock.sentinel.other_theme) is True
+
+    def test_when_reset_then_required(self):
+        p = Page()
+        p.mark_setup(Region(0, 0, 1, 1), mock.sentinel.theme)
+        p.reset_setup()
+        assert p.setup_required(Region(0, 0, 1, 1), mock.sentinel.theme) is True
+
+    def test_when_marked_setup_then_dirty_regions_superseded_by_update(self):
+        p = Page()
+        p.mark_dirty(Region(0, 0, 1, 1))
+        p.mark_setup(Region(0, 0, 1, 1), mock.sentinel.theme)
+        assert p.needs_update is True
+        assert p.request_partial_update() is False
+
+
+class Test_StaticPage_tick:
+
+    def test_when_update_requested_then_redrawn(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+
+        p = StaticPage()
+        p.request_update()
+        p.tick(a_region, a_wm)
+
+        a_wm.request_display_update.assert_called_once_with(a_region)
+        assert p._update_requested is False
+
+    def test_when_touch_active_then_redrawn(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+        a_wm.os.touch.state = True
+        a_wm.os.touch.x = 50
+        a_wm.os.touch.y = 50
+
+        p = StaticPage()
+        p._controls = [MomentaryButton(Region(0, 0, 10, 10))]
+        p.request_update()
+        p.tick(a_region, a_wm)
+        a_wm.reset_mock()
+        p.tick(a_region, a_wm)
+
+        a_wm.request_display_update.assert_called_once_with(a_region)
+
+    def test_when_not_requested_or_touched_and_controls_unchanged_then_not_redrawn(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+
+        p = StaticPage()
+        p._controls = [MomentaryButton(Region(0, 0, 10, 10))]
+        p.request_update()
+        p.tick(a_region, a_wm)
+        a_wm.reset_mock()
+        p.tick(a_region, a_wm)
+
+        a_wm.request_display_update.assert_not_called()
+
+    def test_when_callback_changes_page_state_then_redrawn_with_new_state(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+        a_wm.os.touch.state = True
+        a_wm.os.touch.x = 5
+        a_wm.os.touch.y = 5
+
+        drawn_counts = []
+
+        class CounterPage(StaticPage):
+            count = 0
+
+            def _draw(self, display, region, theme):
+                drawn_counts.append(self.count)
+
+        p = CounterPage()
+        a_button = MomentaryButton(Region(0, 0, 10, 10))
+
+        def increment():
+            p.count += 1
+
+        a_button.on_button_up = increment
+        p._controls = [a_button]
+        p.request_update()
+        p.tick(a_region, a_wm)
+        a_wm.os.touch.state = False
+        p.tick(a_region, a_wm)
+
+        assert drawn_counts == [0, 1]
+
+    def test_when_touch_changes_controls_then_redrawn(self, a_wm):
+
+        a_region = Region(0, 0, 100, 100)
+        a_wm.os.touch.state = True
+        a_wm.os.touch.x = 5
+        a_wm.os.touch.y = 5
+
+        a_button = MomentaryButton(Region(0, 0, 10, 10))
+        p = StaticPage()
+        p._controls = [a_button]
+        p.request_update()
+        p.tick(a_region, a_wm)
+        assert a_button.is_down
+        a_wm.reset_mock()
+        a_wm.os.touch.state = False
+        p.tick(a_region, a_wm)
+
+        assert not a_button.is_down
+        a_wm.request_display_update.assert_called_once_with(a_region)
+
+
+@pytest.fixture
+def a_wm():
+    m = mock.create_autospec(WindowManager, instance=True)
+    m.os = mock.Mock()
+    m.os.touch.state = False
+    m.display = mock.Mock()
+    m.theme = mock.Mock()
+    return m
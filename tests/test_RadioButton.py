@@ -64,6 +64,37 @@ class Test_RadioButton:
             a_radio.process_touch_state(t)
             assert a_radio.current_index == i
 
+    def test_when_touch_outside_then_options_not_processed(self, a_radio, mock_touch_factory):
+
+        t = mock_touch_factory()
+        t.state = True
+        t.x = a_radio.region.x + a_radio.region.width + 10
+        t.y = a_radio.region.y + 1
+
+        calls = []
+        for c in a_radio._controls:
+            c.process_touch_state = calls.append
+
+        a_radio.process_touch_state(t)
+        t.state = False
+        a_radio.process_touch_state(t)
+        assert not calls
+
+    def test_when_touch_moves_outside_then_cancelled(self, a_radio, mock_touch_factory):
+
+        cancelled = []
+        a_radio._controls[1].on_button_cancel = lambda: cancelled.append(True)
+
+        t = self.__a_touch_over(a_radio, 1, mock_touch_factory)
+        a_radio.process_touch_state(t)
+        t.y = a_radio.region.y + a_radio.region.height + 10
+        a_radio.process_touch_state(t)
+        t.state = False
+        a_radio.process_touch_state(t)
+
+        assert cancelled == [True]
+        assert a_radio.current_index == 0
+
     def __a_touch_over(self, a_radio, index, mock_touch_factory):
         """
         Creates a fake touch over a specific index in the radio control.
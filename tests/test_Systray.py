@@ -109,6 +109,20 @@ class Test_Systray_Accessories:
         with pytest.raises(ValueError):
             s.remove_accessory(an_accessory_factory())
 
+    def test_when_removing_all_accessories_then_all_removed_and_torn_down(
+        self, a_systray_with_mock_accessories, a_mock_wm
+    ):
+        l, t = a_systray_with_mock_accessories.accessories()
+        a_systray_with_mock_accessories.remove_all_accessories()
+        assert a_systray_with_mock_accessories.accessories() == ((), ())
+        for a in (*l, *t):
+            a.teardown.assert_called_once()
+
+        region = Region(0, 0, 100, 30)
+        a_systray_with_mock_accessories._tick(region, a_mock_wm)
+        for a in (*l, *t):
+            a._tick.assert_not_called()
+
     def test_when_accessories_called_then_immutable_lists_returned(
         self, a_systray_with_accessories
     ):
@@ -204,6 +218,18 @@ class Test_Systray_Accessory_forwarding:
         t[0]._tick.assert_called_once_with(Region(90, 0, 10, 30), a_mock_wm)
         t[1]._tick.assert_called_once_with(Region(80, 0, 10, 30), a_mock_wm)
 
+    def test_when_accessory_removed_then_not_ticked(
+        self, a_systray_with_mock_accessories, a_mock_wm
+    ):
+        region = Region(0, 0, 100, 30)
+        l, t = a_systray_with_mock_accessories.accessories()
+        a_systray_with_mock_accessories.setup(region, a_mock_wm)
+        a_systray_with_mock_accessories.remove_accessory(l[1])
+        a_systray_with_mock_accessories._tick(region, a_mock_wm)
+        l[0]._tick.assert_called_once_with(Region(0, 0, 10, 30), a_mock_wm)
+        l[1]._tick.assert_not_called()
+        t[0]._tick.assert_called_once_with(Region(90, 0, 10, 30), a_mock_wm)
+
 
 @pytest.fixture
 def an_accessory_factory():
@@ -121,6 +121,131 @@ class Test_Theme_text_height:
             assert isinstance(height, int)
 
 
+class Test_Theme_measure_text:
+
+    def test_when_bitmap_font_then_display_width_and_text_height_returned(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+        assert a_theme.measure_text(a_display, "Hello", 2) == (42, a_theme.text_height(2))
+        a_display.measure_text.assert_called_once_with("Hello", a_theme.text_scale(2))
+
+    def test_when_same_text_measured_again_then_cached(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+        a_theme.measure_text(a_display, "Hello")
+        assert a_theme.measure_text(a_display, "Hello") == (42, a_theme.text_height())
+        a_display.measure_text.assert_called_once()
+
+    def test_when_font_changed_then_measured_again(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+        a_theme.measure_text(a_display, "Hello")
+        a_theme.font = "bitmap6"
+        a_display.measure_text.return_value = 30
+        assert a_theme.measure_text(a_display, "Hello") == (30, a_theme.text_height())
+        assert a_display.measure_text.call_count == 2
+
+    def test_when_setup_then_measured_again(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+        a_theme.measure_text(a_display, "Hello")
+        a_theme.setup(a_display, 1)
+        a_theme.measure_text(a_display, "Hello")
+        assert a_display.measure_text.call_count == 2
+
+    def test_when_scale_differs_then_measured_again(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+        a_theme.measure_text(a_display, "Hello")
+        a_theme.measure_text(a_display, "Hello", 2)
+        assert a_display.measure_text.call_count == 2
+
+    def test_when_collected_then_only_recently_used_measurements_kept(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+
+        a_theme.measure_text(a_display, "A")
+        a_theme.measure_text(a_display, "B")
+        a_theme.collect_text_metrics()
+        a_theme.measure_text(a_display, "A")
+        a_theme.collect_text_metrics()
+        a_display.measure_text.reset_mock()
+
+        a_theme.measure_text(a_display, "A")
+        a_display.measure_text.assert_not_called()
+        a_theme.measure_text(a_display, "B")
+        a_display.measure_text.assert_called_once_with("B", 1)
+
+    def test_when_cache_full_then_stale_measurements_discarded(self):
+        a_theme = DefaultTheme()
+        a_theme.text_metrics_cache_size = 3
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+
+        a_theme.measure_text(a_display, "A")
+        a_theme.measure_text(a_display, "B")
+        a_theme.collect_text_metrics()
+        a_theme.measure_text(a_display, "A")
+        a_theme.measure_text(a_display, "C")
+        a_theme.measure_text(a_display, "D")
+
+        cached_text = [text for _, text, __ in a_theme._Theme__text_widths]
+        assert sorted(cached_text) == ["A", "C", "D"]
+
+    def test_when_many_texts_measured_then_cache_size_bounded(self):
+        a_theme = DefaultTheme()
+        a_theme.text_metrics_cache_size = 3
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+
+        for i in range(10):
+            a_theme.measure_text(a_display, str(i))
+            assert len(a_theme._Theme__text_widths) <= 3
+
+    def test_when_cache_disabled_then_not_cached(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+        a_theme.measure_text(a_display, "Hello", cache=False)
+        assert a_theme.measure_text(a_display, "Hello") == (42, a_theme.text_height())
+        assert a_display.measure_text.call_count == 2
+
+    def test_when_strings_drawn_then_not_cached(self):
+        a_theme = DefaultTheme()
+        a_display = mock.Mock()
+        a_display.measure_text.return_value = 42
+        a_theme.draw_strings(a_display, ["A message"], Region(0, 0, 100, 100))
+        assert not a_theme._Theme__text_widths
+
+
+class Test_Theme_text_batch:
+
+    def test_when_bitmap_font_then_each_item_drawn_at_text_scale(self):
+        a_theme = DefaultTheme()
+        a_theme.base_font_scale = 2
+        a_display = mock.Mock()
+        a_theme.text_batch(a_display, (("a", 1, 2), ("b", 3, 4)), rel_scale=2)
+        assert a_display.text.call_args_list == [
+            mock.call("a", 1, 2, scale=4),
+            mock.call("b", 3, 4, scale=4),
+        ]
+
+    def test_when_bitmap_font_then_matches_text(self):
+        a_theme = DefaultTheme()
+        batch_display = mock.Mock()
+        text_display = mock.Mock()
+        a_theme.text_batch(batch_display, (("a", 1, 2), ("b", 3, 4)), rel_scale=3)
+        a_theme.text(text_display, "a", 1, 2, rel_scale=3)
+        a_theme.text(text_display, "b", 3, 4, rel_scale=3)
+        assert batch_display.text.call_args_list == text_display.text.call_args_list
+
+
 class Test_Theme_dpi_scale_factor:
 
     def test_when_theme_constructed_then_is_not_set(self):
@@ -12,7 +12,7 @@ from unittest import mock
 import pytest
 
 from tmos import OS, Region
-from tmos_ui import DefaultTheme, Page, Theme, WindowManager
+from tmos_ui import DefaultTheme, Page, StaticPage, Theme, WindowManager
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
 # pylint: disable=invalid-name, redefined-outer-name
@@ -151,6 +151,8 @@ class Test_WindowManager_pages:
 
         expected_calls = [
             mock.call.setup(a_wm.content_region, a_wm),
+            mock.call.mark_setup(a_wm.content_region, a_wm.theme),
+            mock.call.request_update(),
             mock.ANY,
             mock.ANY,
             mock.call.will_show(),
@@ -316,6 +318,42 @@ class Test_WindowManager_update_display:
         a_wm.update_display(*args, **kwargs)
         mock_update.assert_called_with(*args, **kwargs)
 
+    def test_when_called_outside_run_loop_then_display_updated(self, a_wm):
+
+        presto = a_wm.os.presto.presto
+        presto.update.reset_mock()
+        a_wm.update_display()
+        presto.update.assert_called_once_with(a_wm.display)
+
+    def test_when_requested_then_args_forwarded_to_os_request_display_update(
+        self, a_wm, monkeypatch
+    ):
+
+        mock_update = mock.Mock()
+        monkeypatch.setattr(a_wm.os, "request_display_update", mock_update)
+
+        args = (1, 2, "a", "b")
+        kwargs = {"c": "d"}
+
+        a_wm.request_display_update(*args, **kwargs)
+        mock_update.assert_called_with(*args, **kwargs)
+
+    def test_when_page_and_systray_drawn_in_one_cycle_then_display_updated_once(self, a_wm):
+
+        a_wm.set_systray_visible(True)
+        a_wm.add_page(Page(), make_current=True)
+        a_wm.os.add_task(a_wm.os.stop)
+
+        presto = a_wm.os.presto.presto
+        presto.update.reset_mock()
+        presto.partial_update.reset_mock()
+
+        a_wm.os.run()
+
+        assert presto.update.call_count + presto.partial_update.call_count == 1
+        w, h = a_wm.display.get_bounds()
+        presto.partial_update.assert_called_once_with(a_wm.display, 0, 0, w, h)
+
 
 class Test_WindowManager_display_system_messages:
 
@@ -442,6 +480,136 @@ class Test_WindowManager_set_theme:
         mock_theme.setup.assert_called_once_with(wm.display, 2)
 
 
+class Test_WindowManager_page_setup:
+
+    def test_when_region_restored_then_background_page_not_setup_again(self, a_wm):
+
+        setups = []
+
+        class TestPage(Page):
+            def setup(self, region, window_manager):
+                setups.append((self, region))
+
+        page_a = TestPage()
+        page_b = TestPage()
+
+        a_wm.set_systray_visible(True)
+        a_wm.add_page(page_a, make_current=True)
+        a_wm.add_page(page_b)
+        a_wm.os.add_task(a_wm.os.stop)
+        a_wm.os.run()
+
+        a_wm.set_current_page(page_b)
+        a_wm.os.run()
+        a_wm.set_systray_visible(False)
+        a_wm.os.run()
+        a_wm.set_systray_visible(True)
+        a_wm.os.run()
+        setups.clear()
+
+        a_wm.set_current_page(page_a)
+        a_wm.os.run()
+        assert not setups
+
+    def test_when_region_changes_then_page_setup_again(self, a_wm):
+
+        setups = []
+
+        class TestPage(Page):
+            def setup(self, region, window_manager):
+                setups.append(region)
+
+        a_wm.add_page(TestPage(), make_current=True)
+        a_wm.os.add_task(a_wm.os.stop)
+        a_wm.os.run()
+        initial_region = a_wm.content_region
+        a_wm.set_systray_visible(True)
+        a_wm.os.run()
+
+        assert setups == [initial_region, a_wm.content_region]
+        assert setups[0] != setups[1]
+
+    def test_when_needs_setup_set_then_page_setup_again(self, a_wm, a_page):
+
+        a_wm.add_page(a_page, make_current=True)
+        a_wm.os.add_task(a_wm.os.stop)
+        a_wm.os.run()
+
+        a_page.setup = mock.Mock()
+        a_page.needs_setup = True
+        a_wm.os.run()
+        a_page.setup.assert_called_once_with(a_wm.content_region, a_wm)
+
+
+class Test_WindowManager_dirty_regions:
+
+    def test_when_only_regions_dirty_then_page_redrawn_in_regions(self, a_wm):
+
+        draws = []
+
+        class TestPage(StaticPage):
+            def _draw(self, display, region, theme):
+                draws.append(display.set_clip.call_args)
+
+        page = TestPage()
+        a_wm.add_page(page, make_current=True)
+        a_wm.os.add_task(a_wm.os.stop)
+        a_wm.os.run()
+        draws.clear()
+
+        dirty_region = Region(10, 10, 5, 5)
+        page.mark_dirty(dirty_region)
+        a_wm.os.run()
+        a_wm.os.run()
+
+        assert draws == [mock.call(*dirty_region)]
+
+    def test_when_regions_dirty_and_update_needed_then_page_fully_redrawn(self, a_wm):
+
+        draws = []
+
+        class TestPage(StaticPage):
+            def _draw(self, display, region, theme):
+                draws.append(display.set_clip.call_args)
+
+        page = TestPage()
+        a_wm.add_page(page, make_current=True)
+        a_wm.os.add_task(a_wm.os.stop)
+        a_wm.os.run()
+        draws.clear()
+
+        page.mark_dirty(Region(10, 10, 5, 5))
+        page.needs_update = True
+        a_wm.os.run()
+        a_wm.os.run()
+
+        assert draws == [mock.call(*a_wm.content_region)]
+
+
+class Test_WindowManager_static_pages:
+
+    def test_when_static_page_without_controls_made_current_then_drawn(self, a_wm):
+
+        draws = []
+
+        class TestPage(StaticPage):
+            def _draw(self, display, region, theme):
+                draws.append(self)
+
+        page_a = TestPage()
+        page_b = TestPage()
+
+        a_wm.add_page(page_a, make_current=True)
+        a_wm.add_page(page_b)
+        a_wm.os.add_task(a_wm.os.stop)
+        a_wm.os.run()
+        assert draws == [page_a]
+
+        a_wm.set_current_page(page_b)
+        a_wm.os.run()
+        assert draws == [page_a, page_b]
+
+
 @pytest.fixture
 def a_wm():
     os_instance = OS()
@@ -463,6 +631,7 @@ def a_mock_page_factory():
         mock_page.execution_frequency = None
         mock_page.title = "Mock Page"
         mock_page.needs_update = False
+        mock_page._dirty_regions = []
         return mock_page
 
     return make
@@ -76,6 +76,26 @@ class Test__Button_set_is_down:
         a_test_button.assert_events_called(down=False, up=False, cancel=False)
 
 
+class Test__Button_needs_draw:
+
+    def test_when_not_drawn_then_needs_draw(self, a_test_button):
+        assert a_test_button.needs_draw is True
+
+    def test_when_drawn_then_no_longer_needs_draw(self, a_test_button):
+        a_test_button.draw(mock.Mock(), mock.Mock())
+        assert a_test_button.needs_draw is False
+
+    def test_when_state_changes_after_draw_then_needs_draw(self, a_test_button):
+        a_test_button.draw(mock.Mock(), mock.Mock())
+        a_test_button.set_is_down(True)
+        assert a_test_button.needs_draw is True
+
+    def test_when_title_changes_after_draw_then_needs_draw(self, a_test_button):
+        a_test_button.draw(mock.Mock(), mock.Mock())
+        a_test_button.title = "Changed"
+        assert a_test_button.needs_draw is True
+
+
 @pytest.fixture
 def a_region():
     return Region(10, 20, 100, 200)
@@ -7,8 +7,19 @@ Tests for misc items in the tmos_ui module.
 
 import time
 
+from unittest import mock
+
+import pytest
+
 from tmos import Region
-from tmos_ui import inset_region, is_within, to_screen
+from tmos_ui import (
+    bounding_region,
+    get_pen,
+    inset_region,
+    intersect_region,
+    is_within,
+    to_screen,
+)
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
 # pylint: disable=invalid-name
@@ -66,3 +77,61 @@ class Test_inset_region:
     def test_when_only_x_supplied_then_used_to_inset_y(self):
         r = Region(10, 20, 30, 40)
         assert inset_region(r, 2) == Region(12, 22, 26, 36)
+
+
+class Test_intersect_region:
+
+    def test_when_regions_overlap_then_overlap_returned(self):
+        a = Region(10, 20, 30, 40)
+        b = Region(20, 10, 30, 20)
+        assert intersect_region(a, b) == Region(20, 20, 20, 10)
+        assert intersect_region(b, a) == Region(20, 20, 20, 10)
+
+    def test_when_region_contained_then_contained_region_returned(self):
+        a = Region(10, 20, 30, 40)
+        b = Region(15, 25, 5, 5)
+        assert intersect_region(a, b) == b
+
+    def test_when_regions_disjoint_then_zero_size(self):
+        a = Region(10, 20, 30, 40)
+        b = Region(100, 200, 30, 40)
+        _, __, w, h = intersect_region(a, b)
+        assert w == 0
+        assert h == 0
+
+
+class Test_bounding_region:
+
+    def test_when_single_region_then_region_returned(self):
+        r = Region(10, 20, 30, 40)
+        assert bounding_region([r]) == r
+
+    def test_when_multiple_regions_then_encloses_all(self):
+        regions = [Region(10, 20, 5, 5), Region(30, 5, 10, 10), Region(0, 30, 1, 1)]
+        assert bounding_region(regions) == Region(0, 5, 40, 26)
+
+    def test_when_no_regions_then_ValueError_raised(self):
+        with pytest.raises(ValueError):
+            bounding_region([])
+
+
+class Test_get_pen:
+
+    def test_when_called_then_pen_created_for_color(self):
+        a_display = mock.Mock()
+        pen = get_pen(a_display, (1, 2, 3))
+        a_display.create_pen.assert_called_once_with(1, 2, 3)
+        assert pen is a_display.create_pen.return_value
+
+    def test_when_called_again_with_same_color_then_pen_reused(self):
+        a_display = mock.Mock()
+        pen = get_pen(a_display, (1, 2, 3))
+        assert get_pen(a_display, (1, 2, 3)) is pen
+        a_display.create_pen.assert_called_once()
+
+    def test_when_different_display_then_new_pen_created(self):
+        display_a = mock.Mock()
+        display_b = mock.Mock()
+        get_pen(display_a, (1, 2, 3))
+        get_pen(display_b, (1, 2, 3))
+        display_b.create_pen.assert_called_once_with(1, 2, 3)